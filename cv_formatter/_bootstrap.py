@@ -0,0 +1,21 @@
+"""
+[MODULE: BOOTSTRAP]
+Role: The 'Pre-Flight'.
+Responsibility: Pay one-time startup costs at process boot, not inside the first user request.
+Flow: Entry point (CLI / worker) -> import cv_formatter._bootstrap -> .env + Config + langdetect profiles loaded.
+Logic:
+- Loading '.env' is disk I/O. Doing it during the first CV turns a cold start into a latency spike.
+- Same for the langdetect profiles (JSON n-gram maps parsed from disk on first detection).
+- Importing this module once at the top of an entry point moves that cost to boot time.
+- Idempotent: config.get_config() and get_detector_factory() are cached, so later imports are free.
+"""
+from cv_formatter.config import get_config
+
+def warm_up():
+    """Loads .env, builds the Config singleton and the language detector. Safe to call any number of times."""
+    from cv_formatter.etl.triage import get_detector_factory
+    config = get_config()
+    get_detector_factory()
+    return config
+
+warm_up()
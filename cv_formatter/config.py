@@ -2,44 +2,73 @@
 [MODULE: CONFIGURATION]
 Role: Singleton Source of Truth.
 Responsibility: specific logic to load environment variables securely.
-Flow: User -> .env -> os.environ -> Config Class -> Application.
+Flow: User -> .env -> os.environ -> get_config() (cached) -> Config Instance -> Application.
 Warning: Do not hardcode secrets here. Always use os.getenv.
+Logic:
+- '.env' is read from disk at most ONCE per process (guarded by an env flag, so
+  worker processes forked/spawned from a loaded parent also skip the re-read).
+- The Config instance is built once and cached (get_config). Everyone shares it.
 """
 import os
+import functools
 from dotenv import load_dotenv
 
-# Load environment variables from .env file immediately upon import.
-# This ensures that any module importing 'config' has access to loaded vars.
-load_dotenv()
+# Flag set in os.environ after the first .env load.
+# Inherited by child processes, so multi-worker boots don't hit the disk again.
+_DOTENV_FLAG = "_CV_DOTENV_LOADED"
+
+def _load_env_once():
+    """Loads the .env file into os.environ unless it was already loaded."""
+    if not os.environ.get(_DOTENV_FLAG):
+        load_dotenv()
+        os.environ[_DOTENV_FLAG] = "1"
 
 class Config:
     """
     Central configuration class.
     Acts as a bridge between the OS environment and the Python application.
+    Values are read from os.environ once, at construction time.
     """
-    # LLM Credentials (Now supports Inference.net / OpenAI)
-    # LLM Credentials (Now supports Inference.net / OpenAI)
-    # Default Base Key (fallback)
-    _GLOBAL_API_KEY = os.getenv("OPENAI_API_KEY")
-    
-    # Base URL allows switching providers (e.g. OpenAI vs Inference.net vs LocalAI)
-    OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.inference.net/v1")
-    
-    # --- MODEL CONFIGURATION ---
-    # 1. STRUCTURING (ETL/Facts) 
-    # Supported: inference-net/schematron-8b, inference-net/cliptagger-12b, google/gemma-3-27b-instruct/bf-16
-    MODEL_STRUCTURE = os.getenv("MODEL_STRUCTURE", "inference-net/schematron-8b")
-    API_KEY_STRUCTURE = os.getenv("API_KEY_STRUCTURE", _GLOBAL_API_KEY)
-
-    # 2. ENRICHMENT (Insights/Ideas) - Default: Gemma 3
-    MODEL_ENRICH = os.getenv("MODEL_ENRICH", "google/gemma-3-27b-instruct/bf-16")
-    API_KEY_ENRICH = os.getenv("API_KEY_ENRICH", _GLOBAL_API_KEY)
-
-    # Deprecated but kept for backward compatibility if needed
-    OPENAI_MODEL = MODEL_STRUCTURE
-    
     # Path configuration for file operations
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+    def __init__(self):
+        # LLM Credentials (Now supports Inference.net / OpenAI)
+        # Default Base Key (fallback)
+        self._GLOBAL_API_KEY = os.getenv("OPENAI_API_KEY")
+
+        # Base URL allows switching providers (e.g. OpenAI vs Inference.net vs LocalAI)
+        self.OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.inference.net/v1")
+
+        # --- MODEL CONFIGURATION ---
+        # 1. STRUCTURING (ETL/Facts)
+        # Supported: inference-net/schematron-8b, inference-net/cliptagger-12b, google/gemma-3-27b-instruct/bf-16
+        self.MODEL_STRUCTURE = os.getenv("MODEL_STRUCTURE", "inference-net/schematron-8b")
+        self.API_KEY_STRUCTURE = os.getenv("API_KEY_STRUCTURE", self._GLOBAL_API_KEY)
+
+        # 2. ENRICHMENT (Insights/Ideas) - Default: Gemma 3
+        self.MODEL_ENRICH = os.getenv("MODEL_ENRICH", "google/gemma-3-27b-instruct/bf-16")
+        self.API_KEY_ENRICH = os.getenv("API_KEY_ENRICH", self._GLOBAL_API_KEY)
+
+        # Seconds to wait on the Enrichment model before racing the Fallback model (async path)
+        self.ENRICH_HEDGE_DELAY = float(os.getenv("ENRICH_HEDGE_DELAY", "10"))
+
+        # --- RESULT CACHE (LLM outputs keyed by content hash) ---
+        # Set CV_CACHE_ENABLED=0 to always call the LLM.
+        self.CACHE_ENABLED = os.getenv("CV_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+        self.CACHE_DIR = os.getenv("CV_CACHE_DIR", ".cache")
+
+        # Deprecated but kept for backward compatibility if needed
+        self.OPENAI_MODEL = self.MODEL_STRUCTURE
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Process-wide Config factory.
+    First call loads .env and builds the instance; later calls return the same object.
+    """
+    _load_env_once()
+    return Config()
+
 # Singleton instance to be imported by other modules
-config = Config()
+config = get_config()
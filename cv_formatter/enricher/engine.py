@@ -7,109 +7,420 @@ Logic:
 - Uses a separate configuration for the 'Creative' model (Gemma 3).
 - Prompts are focused on 'Advisory' and 'Market Fit', not data extraction.
 - Fails softly: If Gemma fails to enrich, the main pipeline continues without insights.
+- Batch Mode: 'enrich_many' fans out N CVs concurrently (AsyncOpenAI + asyncio.gather),
+  so a batch costs ~max(RTT) instead of N x RTT. A semaphore caps in-flight calls.
 """
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+from openai import AsyncOpenAI
+from typing import List, NamedTuple, Optional, Tuple, Union
+import asyncio
 import logging
-import json
+import os
+import textwrap
+import time
 
 from cv_formatter.config import config
-from cv_formatter.enricher.schemas import EnrichmentData
+from cv_formatter.enricher.schemas import EnrichmentBatch, EnrichmentData, TimelineAnalysis
+from cv_formatter.enricher.timeline_analyzer import TimelineAnalyzer
+from cv_formatter.formatter.json_formatter import CVData
+from cv_formatter.llm.client import get_openai_client
+from cv_formatter.llm.response_format import get_response_format, parse_completion
+from cv_formatter.llm.retry import MAX_ATTEMPTS, TRANSIENT_ERRORS, backoff
+from cv_formatter.utils import fast_json
+from cv_formatter.utils.result_cache import ResultCache
 from cv_formatter.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# --- PAYLOAD PROJECTION ---
+# Only what the Coach needs goes to the LLM. Contact data, ids, ATS audit and UI flags
+# are dropped: prompt tokens drive both latency (TTFT) and cost.
+_ENRICH_FIELDS = ("full_name", "summary", "experience", "education", "certifications", "skills", "languages")
+_ENRICH_EXPERIENCE_FIELDS = ("title", "company", "start_date", "end_date", "description")
+
+# Enrichment results are reused for a week (same CV + model + prompt version => same answer).
+_CACHE_TTL_SECONDS = 7 * 86400
+
+class _PreparedCV(NamedTuple):
+    candidate_name: str
+    timeline_result: Optional[TimelineAnalysis]
+    messages: list
+    cache_key: str
+    payload: str
+
+# Stateless, so one instance serves every enrichment (no per-call construction).
+_TIMELINE_ANALYZER = TimelineAnalyzer()
+
+# System prompt is built ONCE at import (dedented, so no indentation tokens are billed).
+# It is sent byte-identical on every call, which lets the provider hit its prefix (KV) cache.
+_SYSTEM_PROMPT_ENRICH = textwrap.dedent("""
+    ### ROL: Coach de Carrera AI
+    ### TAREA: Analizar JSON de CV y generar insights (Enriquecimiento).
+
+    --- INSTRUCCIÓN CRÍTICA ---
+    **OUTPUT EN ESPAÑOL (ES-LATAM).**
+
+    --- OBJETIVOS ---
+    1. **Market Signals**: Sugerir cargos (Role Fit) y TechStack clave.
+    2. **Signals (SWOT)**: Fortalezas, Debilidades y Riesgos.
+    3. **Growth**: Potencial de crecimiento (High/Medium/Low).
+    4. **CareerPath**: Habilidades faltantes y certificaciones recomendadas.
+
+    --- FORMATO ---
+    Obedecer JSON Schema `EnrichmentData`. Ser crítico pero constructivo.
+    """).strip()
+
+# Bump when the prompt changes: it routes requests to a fresh provider-side prompt cache.
+_PROMPT_VERSION = "enrich-v1"
+
 class EnrichmentService:
-    def __init__(self):
-        self.client = OpenAI(
+    def __init__(self, concurrency: int = 8):
+        # Shared across instances: reuses the pooled HTTP/TLS connections.
+        self.client = get_openai_client(config.API_KEY_ENRICH, config.OPENAI_BASE_URL)
+        # Async twin of the client, used by the batch path (enrich_many).
+        # It keeps one pooled connection set warm across all concurrent requests.
+        self.async_client = AsyncOpenAI(
             api_key=config.API_KEY_ENRICH,
             base_url=config.OPENAI_BASE_URL
         )
         self.model = config.MODEL_ENRICH # Now Schematron-8b by default
+        self.concurrency = concurrency
 
-    @retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=2, min=5, max=30))
-    def enrich_cv(self, cv_json: dict, cv_id: str) -> EnrichmentData:
+        # Content-addressed result cache (None = disabled)
+        self.cache = ResultCache(os.path.join(config.CACHE_DIR, "enrichment"), ttl_seconds=_CACHE_TTL_SECONDS) \
+            if config.CACHE_ENABLED else None
+
+    # --- SHARED HELPERS (Sync + Async paths) ---
+
+    def _prepare(self, cv: Union[dict, CVData]) -> _PreparedCV:
         """
-        Generates insights based on the already-structured CV data.
+        Normalizes the input into (candidate_name, timeline_result, messages, cache_key, payload).
+
+        Accepts either the CV dict (format_to_dict output) or an already-validated CVData.
+        A CVData is used as-is: no re-validation, serialized straight from pydantic-core.
         """
-        candidate_name = cv_json.get('full_name', 'Unknown')
-        logger.info(f"Enriching CV {cv_id} (Candidate: {candidate_name}) using {self.model}...")
-        
-        # 0. Deterministic Timeline Analysis
-        from cv_formatter.formatter.json_formatter import CVData
-        from cv_formatter.enricher.timeline_analyzer import TimelineAnalyzer
-        
+        if isinstance(cv, CVData):
+            candidate_name = cv.full_name or 'Unknown'
+            cv_dict = cv.model_dump(include=set(_ENRICH_FIELDS) | {"raw_text"}, exclude_none=True)
+        else:
+            candidate_name = cv.get('full_name', 'Unknown')
+            cv_dict = cv
+
+        # Compact JSON (orjson when available) of the slim projection: fewer prompt tokens.
+        clean_json_str = fast_json.dumps(self._slim_payload(cv_dict))
+
+        # Keyed on the exact payload the LLM would see (+ model + prompt version).
+        cache_key = ResultCache.make_key(clean_json_str, self.model, _PROMPT_VERSION)
+
+        return _PreparedCV(candidate_name, self._analyze_timeline(cv), self._build_messages(clean_json_str), cache_key, clean_json_str)
+
+    @staticmethod
+    def _slim_payload(cv_dict: dict) -> dict:
+        """
+        Projects the CV onto the enrichment-relevant fields (see _ENRICH_FIELDS).
+
+        Warning: 'raw_text' is only kept as a rescue channel when structuring found no
+        hard skills, so the Coach can still recover the stack (see scripts/debug_enrichment.py).
+        """
+        slim = {k: cv_dict[k] for k in _ENRICH_FIELDS if cv_dict.get(k) is not None}
+        if "experience" in slim:
+            slim["experience"] = [
+                {k: exp[k] for k in _ENRICH_EXPERIENCE_FIELDS if exp.get(k) is not None}
+                for exp in slim["experience"]
+            ]
+
+        hard_skills = (cv_dict.get("skills") or {}).get("hard_skills")
+        if not hard_skills and cv_dict.get("raw_text"):
+            slim["raw_text"] = cv_dict["raw_text"]
+        return slim
+
+    def _analyze_timeline(self, cv: Union[dict, CVData]) -> Optional[TimelineAnalysis]:
+        """Deterministic Timeline Analysis. Returns None if the CV can't be analyzed."""
         try:
-             cv_obj = CVData(**cv_json)
-             timeline_result = TimelineAnalyzer().analyze(cv_obj)
+             cv_obj = cv if isinstance(cv, CVData) else CVData.model_validate(cv)
+             return _TIMELINE_ANALYZER.analyze(cv_obj)
         except Exception as e:
              logger.warning(f"Timeline analysis failed: {e}")
-             timeline_result = None
-
-        system_prompt = """
-        ### ROL: Coach de Carrera AI
-        ### TAREA: Analizar JSON de CV y generar insights (Enriquecimiento).
-        
-        --- INSTRUCCIÓN CRÍTICA ---
-        **OUTPUT EN ESPAÑOL (ES-LATAM).**
-        
-        --- OBJETIVOS ---
-        1. **Market Signals**: Sugerir cargos (Role Fit) y TechStack clave.
-        2. **Signals (SWOT)**: Fortalezas, Debilidades y Riesgos.
-        3. **Growth**: Potencial de crecimiento (High/Medium/Low).
-        4. **CareerPath**: Habilidades faltantes y certificaciones recomendadas.
-        
-        --- FORMATO ---
-        Obedecer JSON Schema `EnrichmentData`. Ser crítico pero constructivo.
-        """
-
-        # Prepare payload
-        clean_json_str = json.dumps(cv_json, ensure_ascii=False)
+             return None
 
+    def _build_messages(self, clean_json_str: str) -> list:
+        return [
+            {"role": "system", "content": _SYSTEM_PROMPT_ENRICH},
+            {"role": "user", "content": f"Analyze this CV JSON:\n{clean_json_str}"}
+        ]
+
+    @staticmethod
+    def _request_kwargs(model: str, messages: list, response_model=EnrichmentData) -> dict:
+        """Arguments for 'chat.completions.create', shared by every call site."""
+        return dict(
+            model=model,
+            messages=messages,
+            # Precomputed strict JSON Schema (built once per process, not per call).
+            response_format=get_response_format(response_model),
+            # Prompt-caching hint (OpenAI / Inference.net): same key -> same cached prefix.
+            extra_body={"prompt_cache_key": _PROMPT_VERSION},
+        )
+
+    def _cache_get(self, cache_key: str) -> Optional[EnrichmentData]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
         try:
-            completion = self.client.beta.chat.completions.parse(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Analyze this CV JSON:\n{clean_json_str}"}
-                ],
-                response_format=EnrichmentData,
-            )
-            
-            result = completion.choices[0].message.parsed
-            # Ensure the ID matches the source
-            result.target_cv_id = cv_id
-            
-            # Inject Deterministic Analysis
-            if timeline_result:
-                result.timeline_analysis = timeline_result
-            
-            return result
+            return EnrichmentData.model_validate_json(cached)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {cache_key}: {e}")
+            return None
+
+    def _cache_set(self, cache_key: str, result: EnrichmentData) -> None:
+        if self.cache is not None:
+            self.cache.set(cache_key, result.model_dump_json())
+
+    @staticmethod
+    def _finalize(result: EnrichmentData, cv_id: str, timeline_result) -> EnrichmentData:
+        # Ensure the ID matches the source + Inject Deterministic Analysis.
+        # (EnrichmentData is frozen: derive a copy instead of mutating.)
+        update = {"target_cv_id": cv_id}
+        if timeline_result:
+            update["timeline_analysis"] = timeline_result
+        return result.model_copy(update=update)
+
+    # --- SYNC PATH (Single CV) ---
+
+    def _create(self, model: str, messages: list, response_model=EnrichmentData):
+        kwargs = self._request_kwargs(model, messages, response_model)
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return self.client.chat.completions.create(**kwargs)
+            except TRANSIENT_ERRORS as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"Transient LLM error on {model} ({type(e).__name__}), retrying...")
+                time.sleep(backoff(attempt, e))
+
+    def _parse(self, model: str, messages: list) -> EnrichmentData:
+        return parse_completion(EnrichmentData, self._create(model, messages))
+
+    def enrich_cv(self, cv: Union[dict, CVData], cv_id: str) -> EnrichmentData:
+        """
+        Generates insights based on the already-structured CV data.
+        'cv' may be the CV dict or a CVData instance (skips re-validation).
+        """
+        # 0. Deterministic Timeline Analysis + Prepare payload
+        prepared = self._prepare(cv)
+
+        # 1. Cache hit => no LLM round-trip at all
+        cached = self._cache_get(prepared.cache_key)
+        if cached is not None:
+            logger.info(f"Enrichment cache hit for CV {cv_id} (Candidate: {prepared.candidate_name}).")
+            return self._finalize(cached, cv_id, prepared.timeline_result)
+
+        return self._enrich_prepared(prepared, cv_id)
+
+    def _enrich_prepared(self, prepared: _PreparedCV, cv_id: str) -> Optional[EnrichmentData]:
+        """
+        LLM step of enrich_cv for a CV that is already prepared (and known to miss the cache).
+        Shared with enrich_batch's per-CV fallback, so nothing is prepared twice.
+        """
+        candidate_name, timeline_result, messages, cache_key, _ = prepared
+        logger.info(f"Enriching CV {cv_id} (Candidate: {candidate_name}) using {self.model}...")
+
+        try:
+            result = self._parse(self.model, messages)
+            self._cache_set(cache_key, result)
+            return self._finalize(result, cv_id, timeline_result)
 
         except Exception as e:
             logger.error(f"Enrichment Failed with primary model {self.model}: {e}")
-            
-            # FALLBACK STRATEGY
+
+            # FALLBACK STRATEGY (one hop: permanent errors are not retried first)
             fallback_model = config.MODEL_STRUCTURE
             if fallback_model and fallback_model != self.model:
                 logger.info(f"⚠ Rerouting enrichment to Fallback Model: {fallback_model}...")
                 try:
-                    completion = self.client.beta.chat.completions.parse(
-                        model=fallback_model,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": f"Analyze this CV JSON:\n{clean_json_str}"}
-                        ],
-                        response_format=EnrichmentData,
-                    )
-                    result = completion.choices[0].message.parsed
-                    result.target_cv_id = cv_id
-                    if timeline_result:
-                        result.timeline_analysis = timeline_result
-                    
+                    result = self._parse(fallback_model, messages)
+                    # Not cached: the key names the primary model, and a fallback answer stored
+                    # under it would shadow the primary for the whole TTL.
+                    result = self._finalize(result, cv_id, timeline_result)
                     logger.info("Fallback Enrichment Successful.")
                     return result
                 except Exception as fallback_err:
                     logger.error(f"Fallback model also failed: {fallback_err}")
-            
+
             return None
+
+    # --- BULK PATH (K CVs per LLM call) ---
+
+    def enrich_batch(self, items: List[Tuple[Union[dict, CVData], str]], batch_size: int = 4) -> List[Optional[EnrichmentData]]:
+        """
+        Throughput mode for nightly/bulk runs: packs 'batch_size' CVs into ONE request.
+
+        Flow: Cache lookup per CV -> misses chunked by K -> one EnrichmentBatch call per chunk.
+        Why: the fixed per-call overhead (system prompt, scheduling) is paid once per K CVs.
+        Safety: 'target_cv_id' is re-assigned from INPUT order. If the model returns the wrong
+        number of results (or the call fails), that chunk falls back to per-CV enrich_cv.
+        Tune K by the model's context window (4-8 is typical for CV-sized payloads).
+        """
+        prepared = [self._prepare(cv) for cv, _ in items]
+        results: List[Optional[EnrichmentData]] = [None] * len(items)
+
+        pending = []
+        for i, ((_, cv_id), prep) in enumerate(zip(items, prepared)):
+            cached = self._cache_get(prep.cache_key)
+            if cached is not None:
+                results[i] = self._finalize(cached, cv_id, prep.timeline_result)
+            else:
+                pending.append(i)
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            logger.info(f"[Bulk] Enriching {len(chunk)} CVs in one call using {self.model}...")
+
+            # Payloads are already compact JSON: splice them instead of re-serializing.
+            batch_json = "[" + ",".join(
+                f'{{"cv_id":{fast_json.dumps(items[i][1])},"cv":{prepared[i].payload}}}' for i in chunk
+            ) + "]"
+            messages = [
+                {"role": "system", "content": _SYSTEM_PROMPT_ENRICH},
+                {"role": "user", "content": (
+                    "Analyze EACH CV in this JSON array independently. "
+                    "Return exactly one result per CV, in the same order, with target_cv_id = cv_id:\n"
+                    f"{batch_json}"
+                )}
+            ]
+
+            try:
+                completion = self._create(self.model, messages, EnrichmentBatch)
+                batch = parse_completion(EnrichmentBatch, completion).results
+            except Exception as e:
+                logger.error(f"[Bulk] Batch call failed: {e}")
+                batch = []
+
+            if len(batch) != len(chunk):
+                logger.warning(f"[Bulk] Expected {len(chunk)} results, got {len(batch)}. Falling back to per-CV enrichment.")
+                for i in chunk:
+                    results[i] = self._enrich_prepared(prepared[i], items[i][1])
+                continue
+
+            for i, result in zip(chunk, batch):
+                self._cache_set(prepared[i].cache_key, result)
+                results[i] = self._finalize(result, items[i][1], prepared[i].timeline_result)
+
+        return results
+
+    # --- ASYNC PATH (Batch) ---
+
+    async def _acreate(self, model: str, messages: list):
+        kwargs = self._request_kwargs(model, messages)
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                return await self.async_client.chat.completions.create(**kwargs)
+            except TRANSIENT_ERRORS as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"Transient LLM error on {model} ({type(e).__name__}), retrying...")
+                await asyncio.sleep(backoff(attempt, e))
+
+    async def _aparse(self, model: str, messages: list) -> EnrichmentData:
+        return parse_completion(EnrichmentData, await self._acreate(model, messages))
+
+    async def _hedged_parse(self, messages: list) -> Tuple[EnrichmentData, str]:
+        """
+        Hedged request: Primary first, Fallback raced in if Primary is slow or fails.
+
+        Flow:
+            1. Fire Primary (self.model).
+            2. Wait up to ENRICH_HEDGE_DELAY seconds.
+            3. If Primary hasn't succeeded yet, fire Fallback (MODEL_STRUCTURE) too.
+            4. First successful response wins; the loser is cancelled.
+        Wall-time: min(primary, HEDGE_DELAY + fallback) instead of primary + fallback.
+        Returns: (result, model that produced it).
+        Raises: The last error if every model failed.
+        """
+        fallback_model = config.MODEL_STRUCTURE
+        primary = asyncio.create_task(self._aparse(self.model, messages))
+        if not fallback_model or fallback_model == self.model:
+            return await primary, self.model
+
+        pending = {primary}
+        try:
+            await asyncio.wait(pending, timeout=config.ENRICH_HEDGE_DELAY)
+            if primary.done():
+                if primary.exception() is None:
+                    return primary.result(), self.model
+                logger.error(f"[Async] Enrichment Failed with primary model {self.model}: {primary.exception()}")
+                logger.info(f"⚠ Rerouting enrichment to Fallback Model: {fallback_model}...")
+                pending = set()
+            else:
+                logger.info(f"[Async] Primary slower than {config.ENRICH_HEDGE_DELAY}s. Hedging with {fallback_model}...")
+
+            fallback = asyncio.create_task(self._aparse(fallback_model, messages))
+            pending.add(fallback)
+
+            last_error = primary.exception() if primary.done() else None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result(), fallback_model if task is fallback else self.model
+                    last_error = task.exception()
+                    logger.error(f"[Async] Hedged enrichment attempt failed: {last_error}")
+            raise last_error
+        finally:
+            # Cancel the losers (or everything, if we were cancelled ourselves).
+            for task in pending:
+                task.cancel()
+
+    async def enrich_cv_async(self, cv: Union[dict, CVData], cv_id: str) -> EnrichmentData:
+        """
+        Async twin of enrich_cv. Same prompt, non-blocking I/O.
+        Fallback is hedged (raced) instead of serial: see _hedged_parse.
+        """
+        candidate_name, timeline_result, messages, cache_key, _ = self._prepare(cv)
+
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"[Async] Enrichment cache hit for CV {cv_id} (Candidate: {candidate_name}).")
+            return self._finalize(cached, cv_id, timeline_result)
+
+        logger.info(f"[Async] Enriching CV {cv_id} (Candidate: {candidate_name}) using {self.model}...")
+
+        try:
+            result, answered_by = await self._hedged_parse(messages)
+        except Exception as e:
+            logger.error(f"[Async] Enrichment failed for CV {cv_id}: {e}")
+            return None
+
+        # Only primary answers are cached (the key names self.model), same rule as enrich_cv.
+        if answered_by == self.model:
+            self._cache_set(cache_key, result)
+        return self._finalize(result, cv_id, timeline_result)
+
+    async def enrich_many(self, items: List[Tuple[Union[dict, CVData], str]]) -> List[Optional[EnrichmentData]]:
+        """
+        Enriches a batch of (cv, cv_id) pairs concurrently.
+
+        Flow: N requests submitted at once -> Semaphore caps in-flight calls -> gather.
+        Returns: One entry per input, in input order. Failed items come back as None
+        (same soft-fail contract as enrich_cv).
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _enrich_one(cv: Union[dict, CVData], cv_id: str) -> Optional[EnrichmentData]:
+            async with semaphore:
+                return await self.enrich_cv_async(cv, cv_id)
+
+        results = await asyncio.gather(
+            *[_enrich_one(cv, cv_id) for cv, cv_id in items],
+            return_exceptions=True
+        )
+
+        # Soft-fail: Exceptions that escaped retries are logged and mapped to None.
+        final = []
+        for (_, cv_id), res in zip(items, results):
+            if isinstance(res, BaseException):
+                logger.error(f"[Async] Enrichment for CV {cv_id} failed: {res}")
+                final.append(None)
+            else:
+                final.append(res)
+        return final
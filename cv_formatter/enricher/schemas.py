@@ -6,21 +6,32 @@ Flow: EnrichmentService -> Pydantic Validation -> cv_insights.json
 Logic:
 - Separates 'Market Signals' (Hard data/Stack) from 'Coach Feedback' (Soft suggestions).
 - 'target_cv_id' ensures strict linkage to the original CV (Facts).
+- Models are FROZEN: results can be cached and shared safely. Use 'model_copy(update=...)' to derive.
+- Validators are built and warmed at import time, so the first enrichment doesn't pay schema-compile cost.
 """
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+# Immutable contracts: once validated, an insight never changes under a consumer's feet.
+_FROZEN = ConfigDict(frozen=True)
 
 class TechStack(BaseModel):
+    model_config = _FROZEN
+
     stack_detected: List[str] = Field(default_factory=list, description="Core technologies detected (e.g. 'Python', 'React', 'AWS')")
     tools_detected: List[str] = Field(default_factory=list, description="Tools and platforms (e.g. 'Jira', 'Docker', 'Kubernetes')")
     role_fit_scenarios: List[str] = Field(default_factory=list, description="Possible job titles this profile fits (e.g. 'Backend Engineer', 'DevOps')")
 
 class CareerPath(BaseModel):
+    model_config = _FROZEN
+
     missing_critical_skills: List[str] = Field(default_factory=list, description="Skills often required for this role level but missing")
     recommended_certifications: List[str] = Field(default_factory=list, description="Industry standard certs that would add value")
     improvement_tips: List[str] = Field(default_factory=list, description="Actionable advice to improve the CV content")
 
 class TimelineAnalysis(BaseModel):
+    model_config = _FROZEN
+
     total_years_experience: Optional[float] = Field(None, description="Calculated years of experience")
     avg_tenure_months: Optional[int] = Field(None, description="Average months per role")
     detected_gaps: List[str] = Field(default_factory=list, description="List of gaps > 6 months (e.g. 'Aug 2018 – Jan 2019')")
@@ -28,12 +39,17 @@ class TimelineAnalysis(BaseModel):
     stability_score: Optional[int] = Field(None, description="Stability score 1-10")
 
 class ProfileSignals(BaseModel):
+    model_config = _FROZEN
+
     strengths: List[str] = Field(default_factory=list, description="Key strengths identified")
     weaknesses: List[str] = Field(default_factory=list, description="Key weaknesses or areas for improvement")
     risk_flags: List[str] = Field(default_factory=list, description="Red flags like inconsistent dates or vague descriptions")
-    growth_potential: Optional[str] = Field(None, description="High / Medium / Low assessment")
+    # Closed set: smaller schema/grammar for structured decoding, no free-text drift ("Alto", "medium-high"...)
+    growth_potential: Optional[Literal["High", "Medium", "Low"]] = Field(None, description="High / Medium / Low assessment")
 
 class EnrichmentData(BaseModel):
+    model_config = _FROZEN
+
     target_cv_id: str = Field(..., description="UUID of the original CV this analysis belongs to")
     
     # Quantitative (Deterministic)
@@ -43,3 +59,20 @@ class EnrichmentData(BaseModel):
     market_signals: TechStack = Field(default_factory=TechStack, description="Technical breakdown")
     coach_feedback: CareerPath = Field(default_factory=CareerPath, description="Strategic advice")
     profile_signals: Optional[ProfileSignals] = Field(None, description="SWOT-style analysis")
+
+class EnrichmentBatch(BaseModel):
+    """Bulk mode: K CVs analyzed in ONE LLM call. Results follow the input order."""
+    model_config = _FROZEN
+
+    results: List[EnrichmentData] = Field(default_factory=list, description="One analysis per input CV, same order as the input array")
+
+# --- VALIDATOR WARM-UP ---
+# Force-build every core schema now and run one throwaway validation through the full tree,
+# so the first real 'enrich_cv' response is validated on a hot path.
+for _model in (TechStack, CareerPath, TimelineAnalysis, ProfileSignals, EnrichmentData, EnrichmentBatch):
+    _model.model_rebuild(force=True)
+
+try:
+    EnrichmentData.model_validate_json('{"target_cv_id":"warmup"}')
+except Exception:  # Warm-up must never break imports.
+    pass
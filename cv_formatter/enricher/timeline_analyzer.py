@@ -8,67 +8,78 @@ Logic:
 - Gap logic: > 6 months between roles.
 - Tenure logic: Sum of all role durations? Or time since first role?
 """
-from datetime import datetime, date
-from typing import List, Optional, Tuple
-from cv_formatter.formatter.json_formatter import CVData, ExperienceEntry
+from operator import itemgetter
+from cv_formatter.formatter.json_formatter import CVData
 from cv_formatter.enricher.schemas import TimelineAnalysis
+from cv_formatter.utils.date_normalizer import DateNormalizer, month_index_to_date, today_month_index
+
+def _empty_timeline() -> TimelineAnalysis:
+    """
+    Result for CVs without (parsable) experience.
+    A fresh instance per call: 'frozen' blocks assignment, not 'detected_gaps.append(...)',
+    so a shared instance could be corrupted by any caller.
+    """
+    return TimelineAnalysis(total_years_experience=0, avg_tenure_months=0, stability_score=0)
 
 class TimelineAnalyzer:
     
     def analyze(self, cv_data: CVData) -> TimelineAnalysis:
-        from cv_formatter.utils.date_normalizer import DateNormalizer
         experiences = cv_data.experience
         if not experiences:
-            return TimelineAnalysis(total_years_experience=0, avg_tenure_months=0, stability_score=0)
+            return _empty_timeline()
             
-        # Parse all dates first
-        parsed_entries = []
+        # Decorate-Sort-Undecorate: every date is parsed exactly ONCE into (start, end, entry)
+        # tuples, then sorted by the pre-parsed key. No re-parsing inside sort or the loop.
+        # Dates are packed month indexes (year * 12 + month - 1): spans and gaps are int math.
+        decorated = []
+        today_index = today_month_index()  # One clock read per CV, shared by every 'Present'
         for e in experiences:
-            start = DateNormalizer.parse_to_date(e.start_date)
-            end = DateNormalizer.parse_to_date(e.end_date, is_end_date=True)
-            if start:
-                parsed_entries.append({'start': start, 'end': end, 'entry': e})
+            start = DateNormalizer.parse_to_month_index(e.start_date)
+            if start is None:
+                continue
+            end = DateNormalizer.parse_to_month_index(e.end_date, is_end_date=True, today_index=today_index)
+            # Unparsable end (e.g. "sometime"): count it as a one-month role instead of crashing
+            decorated.append((start, end if end is not None else start, e))
 
-        if not parsed_entries:
-            return TimelineAnalysis(total_years_experience=0, avg_tenure_months=0, stability_score=0)
+        if not decorated:
+            return _empty_timeline()
 
         # Sort by start date (ascending)
-        sorted_parsed = sorted(parsed_entries, key=lambda x: x['start'])
-        
-        # 1. Total Experience (First Start -> Last End)
-        first_start = sorted_parsed[0]['start']
-        # Find the latest end date among all entries
-        latest_end = max([x['end'] for x in sorted_parsed])
+        decorated.sort(key=itemgetter(0))
         
-        total_months_span = (latest_end.year - first_start.year) * 12 + (latest_end.month - first_start.month)
-        total_years = round(total_months_span / 12, 1) if total_months_span > 0 else 0.1
-
-        # 2. Tenure & Gaps
+        # 1. Tenure & Gaps
         total_role_months = 0
         gaps = []
         role_count = 0
         last_role_end = None
         
-        for item in sorted_parsed:
-            start = item['start']
-            end = item['end']
+        for start, end, _ in decorated:
             
             # Gap Check
-            if last_role_end and start > last_role_end:
-                gap_months = (start.year - last_role_end.year) * 12 + (start.month - last_role_end.month)
+            if last_role_end is not None and start > last_role_end:
+                gap_months = start - last_role_end
                 if gap_months > 6:
-                    gaps.append(f"Gap detected: {last_role_end.strftime('%b %Y')} – {start.strftime('%b %Y')} ({gap_months} months)")
+                    # Dates are only materialized here, for the human-readable message
+                    gaps.append(
+                        f"Gap detected: {month_index_to_date(last_role_end).strftime('%b %Y')} – "
+                        f"{month_index_to_date(start).strftime('%b %Y')} ({gap_months} months)"
+                    )
             
-            # Update last end
+            # Update last end (running max, so after the loop it is the latest end overall)
             if last_role_end is None or end > last_role_end:
                 last_role_end = end
 
             # Tenure
-            role_months = (end.year - start.year) * 12 + (end.month - start.month)
+            role_months = end - start
             if role_months < 1: role_months = 1
             total_role_months += role_months
             role_count += 1
             
+        # 2. Total Experience (First Start -> Last End)
+        # No extra pass: the list is sorted by start and the loop already tracked the latest end.
+        total_months_span = last_role_end - decorated[0][0]
+        total_years = round(total_months_span / 12, 1) if total_months_span > 0 else 0.1
+
         avg_tenure = int(total_role_months / role_count) if role_count > 0 else 0
         job_hopping = avg_tenure < 12 and role_count > 2
         
@@ -85,5 +96,3 @@ class TimelineAnalyzer:
             job_hopping_risk=job_hopping,
             stability_score=score
         )
-
-import re # Ensure re is imported if not already in global scope or add to imports
@@ -7,49 +7,113 @@ Logic:
 - Emoji Detection: ATS hates emojis. We count and flag them.
 - Special Character Density: Too many non-ascii symbols?
 - Section Headers: Does it follow standard naming?
+- Memoized: the same text (preview, refresh, final render) is audited only once per process.
 """
+import functools
 import re
 import emoji
 from typing import List, Tuple
 from cv_formatter.formatter.json_formatter import ATSAnalysis
 
+# Emojis and non-standard bullets in ONE scan (compiled once at import, not per CV).
+# Group 1: Non-standard bullets. Listed first, so a bullet that is also an emoji (▪)
+#          is counted as a bullet, never as an emoji.
+# Group 2: One emoji "unit": flag pairs, keycaps (#️⃣), or a base emoji with optional skin
+#          tone / VS16 / tag modifiers and ZWJ continuations (👨‍👩‍👧 counts once).
+# The base set is every single-codepoint emoji in emoji.EMOJI_DATA, so it agrees with
+# emoji.emoji_count (📧, ©, 🆗 count; CV bullets like ✦ ❖ ☐ ✗ ★ ✓ don't) without the
+# package's pure-Python walk over the text on every CV.
+_WEIRD_BULLETS = '➤➢➔➜⇒►●■◆▪▫'
+
+def _char_class(codepoints) -> str:
+    """Sorted codepoints -> compact regex class body ('a-fx-z'), escaped."""
+    parts = []
+    points = sorted(codepoints)
+    start = prev = points[0]
+    for cp in points[1:] + [None]:
+        if cp is not None and cp == prev + 1:
+            prev = cp
+            continue
+        parts.append(re.escape(chr(start)) if start == prev else f"{re.escape(chr(start))}-{re.escape(chr(prev))}")
+        if cp is not None:
+            start = prev = cp
+    return ''.join(parts)
+
+_EMOJI_BASE = _char_class(
+    ord(key) for key in emoji.EMOJI_DATA
+    if len(key) == 1 and key not in _WEIRD_BULLETS and not '\U0001F1E6' <= key <= '\U0001F1FF'
+)
+_EMOJI_MOD = r'[\U0001F3FB-\U0001F3FF\uFE0F\U000E0020-\U000E007F]*'
+_ATS_SYMBOLS_RE = re.compile(
+    rf'([{_WEIRD_BULLETS}])'
+    r'|([\U0001F1E6-\U0001F1FF]{2}'
+    r'|[#*0-9]\uFE0F?\u20E3'
+    rf'|[{_EMOJI_BASE}]{_EMOJI_MOD}(?:\u200D[{_EMOJI_BASE}]{_EMOJI_MOD})*)'
+)
+
+# Critical headers in ONE alternation. Each group is a section bucket:
+# 1 = Experience, 2 = Education, 3 = Skills. One scan of the CV instead of up to 15.
+_SECTION_RE = re.compile(
+    r'(experiencia|experience|historial|career|trayectoria)'
+    r'|(educaci|education|formacion|acad[eé]mic)'
+    r'|(skill|habilidad|competencia|tecnolog|stack)',
+    re.IGNORECASE
+)
+
 class ATSChecker:
     
     def check(self, text: str) -> ATSAnalysis:
+        # Cached report is shared, so each caller gets its own copy (ATSAnalysis is mutable).
+        return self._audit(text).model_copy(deep=True)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _audit(text: str) -> ATSAnalysis:
         issues = []
         score = 100
         
+        # Single pass: count emojis and weird bullets together
+        emoji_count = 0
+        weird_bullets = 0
+        for match in _ATS_SYMBOLS_RE.finditer(text):
+            if match.lastindex == 1:
+                weird_bullets += 1
+            else:
+                emoji_count += 1
+
         # 1. Emoji Check
-        emoji_count = emoji.emoji_count(text)
         if emoji_count > 0:
             issues.append(f"Found {emoji_count} emojis/icons. ATS systems cannot read these.")
             score -= (emoji_count * 2) # Penalize 2 points per emoji
             
         # 2. Bullet Point Diversity (Weird symbols)
-        # Using regex to find non-standard bullets
-        weird_bullets = re.findall(r'[➤➢➔➜⇒►●■◆▪▫]', text)
-        if len(weird_bullets) > 5:
+        # Counted by the same scan as the emojis above
+        if weird_bullets > 5:
             issues.append("Excessive use of non-standard bullet points (e.g. ➤, ■). Use standard dash '-' or dot '•'.")
             score -= 10
             
         # 3. Missing Critical Headers
-        text_lower = text.lower()
-        required_sections = ["experi", "educ", "skill", "habilid"]
         missing_sections = []
         
         # Check essentially for "Experience" OR "Experiencia" etc.
         # This is a bit redundant with Triage, but this is for 'quality' scoring
-        has_exp = any(x in text_lower for x in ["experiencia", "experience", "historial", "career", "trayectoria"])
+        found = set()
+        for match in _SECTION_RE.finditer(text):
+            found.add(match.lastindex)
+            if len(found) == 3:
+                break  # All buckets seen: no need to scan the rest of the CV
+
+        has_exp = 1 in found
         if not has_exp:
             missing_sections.append("Experience/Experience")
             score -= 20
             
-        has_edu = any(x in text_lower for x in ["educaci", "education", "formacion", "académic", "academic"])
+        has_edu = 2 in found
         if not has_edu:
             missing_sections.append("Education/Educación")
             score -= 10
             
-        has_skills = any(x in text_lower for x in ["skill", "habilidad", "competencia", "tecnolog", "stack"])
+        has_skills = 3 in found
         if not has_skills:
             missing_sections.append("Skills/Habilidades")
             score -= 10
@@ -7,14 +7,43 @@ Logic:
 - Normalization (NFKC): Solves 'ñ' vs 'n~' issues.
 - Artifact Removal: Maps 10+ types of 'bullet points' (•, ➤, etc.) to a standard dash '-'.
 - Whitespace Collapse: Reduces visual noise while preserving structural newlines.
+- Few Passes: single-char fixes (bullets, U+FFFD) are one str.translate; line-start asterisks
+  and blank runs are one regex pass. Only the paragraph collapse runs separately.
 Warning: Aggressive regex might strip intent if not careful. Current set is conservative.
 """
+import functools
 import re
 import unicodedata
 from cv_formatter.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# --- PRECOMPILED PATTERNS ---
+# Compiled once at import. String patterns would go through re's internal cache (lock + dict lookup) per call.
+# Single-char fixes go through ONE str.translate table (a C loop, no regex engine):
+# - Fancy designer bullets (•, ⁃, ‣, etc): stars, triangles, squares, and arrows common in messy CVs -> '-'
+# - Encoding garbage (U+FFFD) -> removed
+_CHAR_TABLE = str.maketrans(
+    {c: '-' for c in '\u2022\u2023\u25E6\u2043\u2219\u2212\u27a2\u27a4\u25b6➤➢➔➜⇒►●■◆▪▫★☆◦‣∙✓✔✕✖'}
+    | {'\ufffd': None}
+)
+# Fused scanner. Alternatives are tried in order at each position:
+#   1. Simple asterisks used as bullets at start of lines (first, so it owns the leading blanks)
+#   2. Blank runs that actually change (2+ spaces/tabs, or a lone tab). Single spaces never match,
+#      so the replacement callback only runs where the text really differs.
+_FUSED_RE = re.compile(
+    r'(?m)(^\s*\* [ \t]*)'
+    r'|([ \t]{2,}|\t)'
+)
+_FUSED_REPLACEMENTS = {1: '- ', 2: ' '}
+_NL_RE = re.compile(r'\n\s*\n')
+
+def _fused_replace(match: re.Match) -> str:
+    return _FUSED_REPLACEMENTS[match.lastindex]
+
+# Memoized: the same CV text is often cleaned more than once per session (preview, refresh,
+# final render). Strings are immutable, so the cached result is safe to share.
+@functools.lru_cache(maxsize=256)
 def clean_text(text: str) -> str:
     """
     Normalizes and cleans the input text to ensure consistent processing.
@@ -40,26 +69,23 @@ def clean_text(text: str) -> str:
     # --- STAGE 1: UNICODE NORMALIZATION ---
     # Ensures consistent representation of characters (e.g., 'ñ', 'é').
     # 'NFKC' compatibly decomposes characters which helps in regex matching.
-    text = unicodedata.normalize('NFKC', text)
-    
-    # Replaces fancy designer bullets (•, ⁃, ‣, etc) with standard ASCII dashes.
-    # Expanded support for stars, triangles, squares, and arrows common in messy CVs.
-    text = re.sub(r'[\u2022\u2023\u25E6\u2043\u2219\u2212\u27a2\u27a4\u25b6➤➢➔➜⇒►●■◆▪▫★☆◦‣∙✓✔✕✖]', '-', text)
-    
-    # Also standardize simple asterisks used as bullets at start of lines
-    text = re.sub(r'(?m)^\s*\* ', '- ', text)
+    # Fast-path: most pasted UTF-8 text is already NFKC; the check is a scan with no new string.
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
     
-    # --- STAGE 3: ENCODING FIXES ---
-    text = text.replace('\ufffd', '')
+    # --- STAGE 2: BULLETS & ENCODING FIXES (single translate pass) ---
+    # Replaces fancy bullets with standard ASCII dashes and drops U+FFFD.
+    # Done before the scan so "a \ufffd b" still collapses to "a b".
+    text = text.translate(_CHAR_TABLE)
     
-    # --- STAGE 4: WHITESPACE COLLAPSE ---
-    # Critical step: Reduces "   " to " ".
+    # --- STAGE 3+4: LINE BULLETS & WHITESPACE COLLAPSE (single pass) ---
+    # Replaces line-start '* ' with a dash and reduces "   " to " ".
     # WARNING: We preserve \n because they indicate structure (paragraphs/lists).
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = _FUSED_RE.sub(_fused_replace, text)
     
     # --- STAGE 5: VERTICAL SPACING ---
     # Standardizes paragraph breaks to exactly 2 newlines.
-    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = _NL_RE.sub('\n\n', text)
     
     # 6. Trim leading/trailing whitespace
     return text.strip()
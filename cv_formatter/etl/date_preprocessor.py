@@ -41,21 +41,37 @@ class DatePreProcessor:
     """
     
     # Pattern: "Enero 2022 - Presente" or "Jan 2020 - Dec 2021"
+    # No 'Present|Actualidad|...' alternation on the end side: those are plain words the letter
+    # class already covers, and DateNormalizer.normalize() maps them to "Present".
     FULL_RANGE_PATTERN = re.compile(
-        r'([a-zA-ZáéíóúÁÉÍÓÚ]{3,10})\s*(\d{4})\s*[-–—]\s*'
-        r'(Present|Presente|Actualidad|Current|Now|[a-zA-ZáéíóúÁÉÍÓÚ]{3,10})\s*(\d{4})?',
+        rf'({DateNormalizer.MONTH_WORD})\s*(\d{{4}})\s*[-–—]\s*'
+        rf'({DateNormalizer.MONTH_WORD})\s*(\d{{4}})?',
         re.IGNORECASE
     )
     
     # Pattern: "2022 - 2024" or "2022 - Present"
     YEAR_RANGE_PATTERN = re.compile(
-        r'(\d{4})\s*[-–—]\s*(Present|Presente|Actualidad|Current|Now|\d{4})',
+        r'(\d{4})\s*[-–—]\s*(Presente?|Actualidad|Current|Now|\d{4})',
         re.IGNORECASE
     )
+
+    # Month tokens (ES + EN, deduplicated). A set lookup decides if a "Word 2019" match is a
+    # real month-year, instead of trusting any 3-10 letter word ("Python 2019").
+    MONTH_TOKENS = frozenset(DateNormalizer.MONTHS_MAP)
     
+    # Line gate: every strategy below needs 4 consecutive digits somewhere in the line.
+    # Matches whole candidate lines straight out of the full text (no list of all lines).
+    CANDIDATE_LINE_PATTERN = re.compile(r'^.*\d{4}.*$', re.MULTILINE)
+
+    # A standalone 4-digit number (cheap gate before the DateNormalizer fallback).
+    # Digit lookarounds: a phone like '56912345678' is NOT a year.
+    YEAR_PATTERN = re.compile(r'(?<!\d)\d{4}(?!\d)')
+
     # Pattern: Standalone month-year like "Marzo 2019"
+    # Anchored on a word start and a digit-bounded year, so the engine doesn't retry the
+    # word class from every letter of every word, and 'Tel 56912345678' is not "Tel 5691".
     SINGLE_DATE_PATTERN = re.compile(
-        r'([a-zA-ZáéíóúÁÉÍÓÚ]{3,10})\s*(\d{4})',
+        rf'\b({DateNormalizer.MONTH_WORD})\s*(\d{{4}})(?!\d)',
         re.IGNORECASE
     )
 
@@ -68,10 +84,17 @@ class DatePreProcessor:
         Returns: {line_number: DateHint} for lines with detected dates
         """
         results: Dict[int, DateHint] = {}
-        lines = text.split('\n')
         
-        for line_num, line in enumerate(lines):
-            hint = self._extract_from_line(line)
+        # Line numbers follow split('\n') on purpose (they index the text the LLM sees).
+        # Early reject + streaming: one regex pass yields only the lines with a 4-digit run.
+        # Most CV lines (bullets, names, addresses) never become Python strings at all.
+        # Line numbers are counted incrementally, so they still match text.split('\n').
+        line_num = 0
+        last_pos = 0
+        for match in self.CANDIDATE_LINE_PATTERN.finditer(text):
+            line_num += text.count('\n', last_pos, match.start())
+            last_pos = match.start()
+            hint = self._extract_from_line(match.group(0).strip())
             if hint.start_date:  # Only include if we found something
                 results[line_num] = hint
         
@@ -91,15 +114,20 @@ class DatePreProcessor:
         if not line:
             return DateHint(raw_line=line)
         
+        # Classify the line once: both range patterns need a dash-like separator,
+        # so single dates ("Marzo 2019") skip straight to step 3.
+        is_range = '-' in line or '–' in line or '—' in line
+
         # 1. Try full range: "Enero 2022 - Diciembre 2024"
-        match = self.FULL_RANGE_PATTERN.search(line)
+        match = self.FULL_RANGE_PATTERN.search(line) if is_range else None
         if match:
-            start = DateNormalizer.normalize(f"{match.group(1)} {match.group(2)}")
+            # The groups already hold (month, year): no rebuild + re-scan of the text
+            start = DateNormalizer.normalize_parts(match.group(1), match.group(2))
             end_part = match.group(3)
             end_year = match.group(4)
             
             if end_year:
-                end = DateNormalizer.normalize(f"{end_part} {end_year}")
+                end = DateNormalizer.normalize_parts(end_part, end_year)
             else:
                 end = DateNormalizer.normalize(end_part)  # "Present"
             
@@ -111,7 +139,7 @@ class DatePreProcessor:
             )
         
         # 2. Try year range: "2022 - 2024"
-        match = self.YEAR_RANGE_PATTERN.search(line)
+        match = self.YEAR_RANGE_PATTERN.search(line) if is_range else None
         if match:
             start = match.group(1)
             end = DateNormalizer.normalize(match.group(2))
@@ -123,10 +151,11 @@ class DatePreProcessor:
                 raw_line=line
             )
         
-        # 3. Try single date: "Marzo 2019"
-        match = self.SINGLE_DATE_PATTERN.search(line)
-        if match:
-            date = DateNormalizer.normalize(f"{match.group(1)} {match.group(2)}")
+        # 3. Try single date: "Marzo 2019" (first candidate whose word is a month)
+        for match in self.SINGLE_DATE_PATTERN.finditer(line):
+            if match.group(1).lower() not in self.MONTH_TOKENS:
+                continue
+            date = DateNormalizer.normalize_parts(match.group(1), match.group(2))
             return DateHint(
                 start_date=date,
                 end_date=None,
@@ -135,7 +164,7 @@ class DatePreProcessor:
             )
         
         # 4. Fallback to DateNormalizer for any year pattern
-        if re.search(r'\d{4}', line):
+        if self.YEAR_PATTERN.search(line):
             start, end = DateNormalizer.extract_range(line)
             if start != "Unknown":
                 return DateHint(
@@ -4,15 +4,29 @@ Role: The 'Intelligent Architect'.
 Responsibility: Extract strict structure (Experience, Education, Skills) directly from Raw Text using LLM.
 Reasoning: Previous A/B approach (classify lines -> group) was too fragile for messy CVs.
 Direct structured output (Schematron) is more robust for context understanding.
+Batch Mode: 'extract_batch' structures N CVs concurrently (AsyncOpenAI + asyncio.gather),
+a semaphore caps in-flight calls. Same prompt and schema as the one-shot path.
+Streaming: both paths (one-shot and batch) stream the JSON and validate it once the last chunk
+lands, so time-to-first-token is visible in the logs and no socket sits idle behind one big read.
+Payload: contact-only lines (email, phone, profile URLs) are dropped before the call. ExtractedCV
+has no field for them (Triage already pulled the email), so they were billed tokens for nothing.
+Cache: results are stored by hash(text + model + prompt version), so re-runs and duplicate
+submissions of the same CV skip the LLM call entirely.
 """
-from openai import OpenAI
 from pydantic import BaseModel, Field
+from openai import AsyncOpenAI
 from typing import List, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential
+import asyncio
+import os
+import re
+import textwrap
 import time
-import uuid
 
 from cv_formatter.config import config
+from cv_formatter.llm.client import get_openai_client
+from cv_formatter.llm.response_format import get_response_format
+from cv_formatter.llm.retry import MAX_ATTEMPTS, TRANSIENT_ERRORS, backoff
+from cv_formatter.utils.result_cache import ResultCache
 from cv_formatter.utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -58,6 +72,64 @@ class ExtractedCV(BaseModel):
     certifications: List[CertificationItem] = Field(default_factory=list)
     skills: TechnicalSkills = Field(default_factory=TechnicalSkills)
 
+# ============================================================================
+# PROMPT
+# ============================================================================
+
+# Built ONCE at import and shared by the sync and async paths (identical bytes on every call).
+_SYSTEM_PROMPT_STRUCTURE = textwrap.dedent("""
+    ROLE: Expert CV Parser & Data Structurer.
+    TASK: Convert the provided Raw CV Text into a strict, high-fidelity JSON structure.
+
+    CRITICAL RULES:
+    1. EXPERIENCE GROUPING:
+       - DETECT COMPANY & TITLE: If a line says "Company, Title" (e.g. "Google, Software Engineer"), you MUST split them.
+       - EXTRACT DESCRIPTION: converting all bullet points into the 'description_bullets' list. If there are no bullets, put the text in 'description'. DO NOT OMIT THIS.
+       - DATES: If dates appear at the VERY END of the document or in a detached column, you MUST logically map them to the corresponding Experience entry based on sequence/order.
+
+    2. SKILL SEGREGATION:
+       - "Hard Skills": Technical tools, languages (Python, AWS, Excel), and methodologies.
+       - "Soft Skills": Leadership, communication, teamwork traits.
+       - "Languages": Spoken languages (English, Spanish, etc).
+
+    3. GENERAL:
+       - PRESERVE the original language of the text.
+       - PRESERVE full descriptions. Do not summarize.
+       - If a section is missing, return only what is found.
+    """).strip()
+
+# Bump when the prompt, the payload or the ExtractedCV schema changes: old cache entries stop matching.
+_PROMPT_VERSION = "structure-v3"
+
+# Contact tokens and their labels. A line made ONLY of these (plus separators) carries nothing
+# the schema extracts. Lines that mix them with real content are kept untouched.
+# Deliberately narrow: bare digit runs ("2019 2020 2021", a detached date column) and
+# project/company URLs are content, so they never count as contact data.
+_CONTACT_TOKEN_RE = re.compile(
+    r'[\w.+-]+@[\w-]+\.[\w.-]+'                                                 # email
+    r'|(?:https?://)?(?:www\.)?(?:linkedin\.com|github\.com)/\S*'             # profile URLs only
+    r'|\+\d[\d ().-]{6,}\d'                                                     # phone, '+' prefixed
+    r'|\b(?:tel[eé]fono|tel|phone|m[oó]vil|celular|cel)\b\.?:?\s*\+?\(?\d[\d ().-]{6,}\d'  # labeled phone
+    r'|\b(?:e-?mail|correo|linkedin|github)\b:?',                                 # bare labels
+    re.IGNORECASE
+)
+_CONTACT_LINE_RE = re.compile(r'^(.*(?:@|\d{3}|://|www\.|\.com/).*)$\n?', re.MULTILINE)
+
+def _strip_contact_lines(text: str) -> str:
+    """
+    Removes lines that hold nothing but contact data (see _CONTACT_TOKEN_RE).
+    Only candidate lines (with '@', digits, or a URL shape) are inspected at all.
+    """
+    def _drop(match: re.Match) -> str:
+        rest = _CONTACT_TOKEN_RE.sub('', match.group(1))
+        # Anything left besides separators/punctuation => real content, keep the line.
+        return match.group(0) if any(ch.isalnum() for ch in rest) else ''
+
+    return _CONTACT_LINE_RE.sub(_drop, text)
+
+# Structuring results are reused for a week (same text + model + prompt => same answer).
+_CACHE_TTL_SECONDS = 7 * 86400
+
 # ============================================================================
 # MAIN CLASS
 # ============================================================================
@@ -67,63 +139,122 @@ class SemanticStructurer:
     One-Shot Semantic Structurer using Strict JSON Schema.
     """
     
-    def __init__(self):
-        self.client = OpenAI(
+    def __init__(self, concurrency: int = 8):
+        self.client = get_openai_client(config.API_KEY_STRUCTURE, config.OPENAI_BASE_URL)
+        # Async twin of the client, used by the batch path (extract_batch).
+        self.async_client = AsyncOpenAI(
             api_key=config.API_KEY_STRUCTURE,
             base_url=config.OPENAI_BASE_URL
         )
         self.model = config.MODEL_STRUCTURE
+        self.concurrency = concurrency
+
+        # Content-addressed result cache (None = disabled)
+        self.cache = ResultCache(os.path.join(config.CACHE_DIR, "structure"), ttl_seconds=_CACHE_TTL_SECONDS) \
+            if config.CACHE_ENABLED else None
         logger.info(f"SemanticStructurer (One-Shot) initialized with model: {self.model}")
+
+    @staticmethod
+    def _build_messages(text: str) -> list:
+        return [
+            {"role": "system", "content": _SYSTEM_PROMPT_STRUCTURE},
+            {"role": "user", "content": f"Parse this CV:\n\n{_strip_contact_lines(text)}"}
+        ]
+
+    def _cache_key(self, text: str) -> str:
+        return ResultCache.make_key(text, self.model, _PROMPT_VERSION)
+
+    def _cache_get(self, cache_key: str) -> Optional[ExtractedCV]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+        try:
+            return ExtractedCV.model_validate_json(cached)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {cache_key}: {e}")
+            return None
+
+    def _cache_set(self, cache_key: str, result: ExtractedCV) -> None:
+        # Failures come back as an empty ExtractedCV and are never cached.
+        if self.cache is not None:
+            self.cache.set(cache_key, result.model_dump_json())
+
+    @staticmethod
+    def _log_stats(result: ExtractedCV, elapsed: float, prefix: str = "[Structure]") -> None:
+        # Log Extraction Stats
+        exp_count = len(result.experience)
+        edu_count = len(result.education)
+        skill_count = len(result.skills.hard_skills)
+        logger.info(f"{prefix} Success in {elapsed:.2f}s | Exp: {exp_count}, Edu: {edu_count}, Skills: {skill_count}")
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    def _stream_kwargs(self, messages: list) -> dict:
+        """Arguments for the streamed 'chat.completions.create', shared by the sync and async paths."""
+        return dict(
+            model=self.model,
+            messages=messages,
+            # Precomputed strict JSON Schema (built once per process, not per call).
+            response_format=get_response_format(ExtractedCV),
+            temperature=0,
+            stream=True,
+        )
+
+    @staticmethod
+    def _collect_delta(chunk, parts: list, start_time: float, prefix: str) -> None:
+        # Collect the JSON deltas as they arrive; validation happens once at the end.
+        if not chunk.choices:
+            return
+        delta = chunk.choices[0].delta.content
+        if delta:
+            if not parts:
+                logger.info(f"{prefix} First token after {time.time() - start_time:.2f}s")
+            parts.append(delta)
+
+    @staticmethod
+    def _join_content(parts: list) -> str:
+        if not parts:
+            raise ValueError("Model returned no parsable content")
+        return "".join(parts)
+
+    def _stream_content(self, messages: list, start_time: float) -> str:
+        """One streamed call -> the full JSON text (time-to-first-token is logged)."""
+        parts = []
+        for chunk in self.client.chat.completions.create(**self._stream_kwargs(messages)):
+            self._collect_delta(chunk, parts, start_time, "[Structure]")
+        return self._join_content(parts)
+
     def extract_structure(self, text: str) -> ExtractedCV:
         """
         Extracts the full CV structure in a single LLM pass.
         This provides context-aware grouping (Company + Title + Dates).
         """
+        cache_key = self._cache_key(text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"[Structure] Cache hit for {len(text)} chars.")
+            return cached
+
         logger.info(f"[Structure] Extracting entities from {len(text)} chars...")
         start_time = time.time()
         
-        system_prompt = """
-        ROLE: Expert CV Parser & Data Structurer.
-        TASK: Convert the provided Raw CV Text into a strict, high-fidelity JSON structure.
-        
-        CRITICAL RULES:
-        1. EXPERIENCE GROUPING:
-           - DETECT COMPANY & TITLE: If a line says "Company, Title" (e.g. "Google, Software Engineer"), you MUST split them.
-           - EXTRACT DESCRIPTION: converting all bullet points into the 'description_bullets' list. If there are no bullets, put the text in 'description'. DO NOT OMIT THIS.
-           - DATES: If dates appear at the VERY END of the document or in a detached column, you MUST logically map them to the corresponding Experience entry based on sequence/order.
-           
-        2. SKILL SEGREGATION:
-           - "Hard Skills": Technical tools, languages (Python, AWS, Excel), and methodologies.
-           - "Soft Skills": Leadership, communication, teamwork traits.
-           - "Languages": Spoken languages (English, Spanish, etc).
-        
-        3. GENERAL:
-           - PRESERVE the original language of the text.
-           - PRESERVE full descriptions. Do not summarize.
-           - If a section is missing, return only what is found.
-        """
+        messages = self._build_messages(text)
         
         try:
-            completion = self.client.beta.chat.completions.parse(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Parse this CV:\n\n{text}"}
-                ],
-                response_format=ExtractedCV,
-                temperature=0,
-            )
-            
-            result = completion.choices[0].message.parsed
-            elapsed = time.time() - start_time
-            
-            # Log Extraction Stats
-            exp_count = len(result.experience)
-            edu_count = len(result.education)
-            skill_count = len(result.skills.hard_skills)
-            logger.info(f"[Structure] Success in {elapsed:.2f}s | Exp: {exp_count}, Edu: {edu_count}, Skills: {skill_count}")
+            # Transient errors (network, 429, 5xx) are retried inline; anything else fails fast.
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    content = self._stream_content(messages, start_time)
+                    break
+                except TRANSIENT_ERRORS as e:
+                    if attempt == MAX_ATTEMPTS - 1:
+                        raise
+                    logger.warning(f"[Structure] Transient LLM error ({type(e).__name__}), retrying...")
+                    time.sleep(backoff(attempt, e))
+
+            result = ExtractedCV.model_validate_json(content)
+            self._log_stats(result, time.time() - start_time)
+            self._cache_set(cache_key, result)
             
             return result
             
@@ -131,3 +262,72 @@ class SemanticStructurer:
             logger.error(f"[Structure] Extraction failed: {e}")
             # Return empty structure on failure
             return ExtractedCV()
+
+    # --- ASYNC PATH (Batch) ---
+
+    async def _astream_content(self, messages: list, start_time: float) -> str:
+        """Async twin of _stream_content: same request, deltas read without blocking the loop."""
+        parts = []
+        async for chunk in await self.async_client.chat.completions.create(**self._stream_kwargs(messages)):
+            self._collect_delta(chunk, parts, start_time, "[Async][Structure]")
+        return self._join_content(parts)
+
+    async def _aparse(self, messages: list, start_time: float) -> ExtractedCV:
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                content = await self._astream_content(messages, start_time)
+                return ExtractedCV.model_validate_json(content)
+            except TRANSIENT_ERRORS as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"[Async][Structure] Transient LLM error ({type(e).__name__}), retrying...")
+                await asyncio.sleep(backoff(attempt, e))
+
+    async def extract_structure_async(self, text: str) -> ExtractedCV:
+        """
+        Async twin of extract_structure. Same prompt and schema, non-blocking I/O.
+        """
+        cache_key = self._cache_key(text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"[Async][Structure] Cache hit for {len(text)} chars.")
+            return cached
+
+        logger.info(f"[Async][Structure] Extracting entities from {len(text)} chars...")
+        start_time = time.time()
+
+        try:
+            result = await self._aparse(self._build_messages(text), start_time)
+            self._log_stats(result, time.time() - start_time, "[Async][Structure]")
+            self._cache_set(cache_key, result)
+
+            return result
+
+        except Exception as e:
+            logger.error(f"[Async][Structure] Extraction failed: {e}")
+            return ExtractedCV()
+
+    async def extract_batch(self, texts: List[str], concurrency: Optional[int] = None) -> List[ExtractedCV]:
+        """
+        Structures a batch of CV texts concurrently.
+
+        Flow: N requests submitted at once -> Semaphore caps in-flight calls -> gather.
+        Returns: One ExtractedCV per input, in input order. Failed items come back empty
+        (same soft-fail contract as extract_structure).
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def _extract_one(text: str) -> ExtractedCV:
+            async with semaphore:
+                return await self.extract_structure_async(text)
+
+        results = await asyncio.gather(*[_extract_one(t) for t in texts], return_exceptions=True)
+
+        final = []
+        for res in results:
+            if isinstance(res, BaseException):
+                logger.error(f"[Async][Structure] Batch item failed: {res}")
+                final.append(ExtractedCV())
+            else:
+                final.append(res)
+        return final
@@ -7,10 +7,30 @@ Logic:
 - Uses Pydantic V2 'BaseModel' for high-performance validation.
 - Fields are strongly typed (List[str], Optional[str]) to prevent NullPointerExceptions later.
 - 'AnalysisMetadata' section isolates AI inferences (opinion) from facts (Experience/Education).
+- Ids are UUID4-shaped strings drawn from a process-local PRNG (see _new_id).
 """
-import uuid
+import os
+import random
 from typing import List, Optional
 from pydantic import BaseModel, Field, model_validator
+from cv_formatter.utils.date_normalizer import DateNormalizer
+
+# --- ID GENERATION ---
+# uuid.uuid4() costs one os.urandom(16) syscall per id, and every entry of every CV gets one.
+# These ids are internal handles, not secrets, so a PRNG seeded ONCE from os.urandom is enough.
+# Reseeded in forked children, otherwise two workers would hand out the same sequence.
+_ID_RNG = random.Random(os.urandom(32))
+if hasattr(os, "register_at_fork"):  # Unix only; Windows has no fork() to guard against
+    os.register_at_fork(after_in_child=lambda: _ID_RNG.seed(os.urandom(32)))
+
+# RFC 4122 version (4) and variant (10xx) bits, applied to the 128 random bits
+_UUID4_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID4_SET = (0x4000 << 64) | (0x8000 << 48)
+
+def _new_id() -> str:
+    """Returns a UUID4-formatted id ('xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx'), no syscall."""
+    h = '%032x' % (_ID_RNG.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 class ExperienceEntry(BaseModel):
     """
@@ -21,7 +41,7 @@ class ExperienceEntry(BaseModel):
     
     Warning: date_confidence affects frontend UI - "low" shows warning icon
     """
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Internal unique ID")
+    id: str = Field(default_factory=_new_id, description="Internal unique ID")
     title: Optional[str] = Field(None, description="Job title")
     company: Optional[str] = Field(None, description="Company name")
     start_date: Optional[str] = Field(None, description="MUST extract date (start). Format: YYYY-MM or YYYY. If 'Present', use 'Present'.")
@@ -54,9 +74,16 @@ class ExperienceEntry(BaseModel):
         if self.user_adjusted or self.start_date:
             return self
         
+        title, company, description = self.title or '', self.company or '', self.description or ''
+        # Cheap guard, field by field: no 4-digit run anywhere => no date to recover.
+        # Short-circuits on the first hit (usually the short title), and the common
+        # 'no date at all' case never builds the joined (possibly multi-KB) search text.
+        has_year = DateNormalizer.HAS_YEAR_PATTERN.search
+        if not (has_year(title) or has_year(company) or has_year(description)):
+            return self
+
         # Use DateNormalizer for comprehensive extraction
-        from cv_formatter.utils.date_normalizer import DateNormalizer
-        search_text = f"{self.title or ''} {self.company or ''} {self.description or ''}"
+        search_text = f"{title} {company} {description}"
         
         start, end = DateNormalizer.extract_range(search_text)
         if start != "Unknown":
@@ -67,13 +94,13 @@ class ExperienceEntry(BaseModel):
         return self
 
 class EducationEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Internal unique ID")
+    id: str = Field(default_factory=_new_id, description="Internal unique ID")
     degree: Optional[str] = Field(None, description="Degree or certification name")
     institution: Optional[str] = Field(None, description="University or Institution")
     year: Optional[str] = Field(None, description="Year of graduation or period")
 
 class CertificationEntry(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str = Field(..., description="Name of certification")
     issuer: Optional[str] = Field(None, description="Issuing organization")
     year: Optional[str] = Field(None, description="Year obtained")
@@ -142,7 +169,7 @@ class ATSAnalysis(BaseModel):
 
 
 class CVData(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique ID for this CV version")
+    id: str = Field(default_factory=_new_id, description="Unique ID for this CV version")
     full_name: Optional[str] = Field(None, description="Candidate's full name")
     email: Optional[str] = None
     phone: Optional[str] = None
@@ -171,3 +198,12 @@ def format_to_dict(cv_data: CVData) -> dict:
     Any field not defined in the Schema above will NOT exist in the output.
     """
     return cv_data.model_dump(exclude_none=True)
+
+def format_to_json(cv_data: CVData) -> bytes:
+    """
+    Same contract as format_to_dict, serialized straight to UTF-8 JSON bytes.
+
+    Uses pydantic-core's serializer directly: no intermediate Python dict and no
+    'dict -> json.dumps' round-trip. Prefer this when the result goes over the wire or to disk.
+    """
+    return cv_data.__pydantic_serializer__.to_json(cv_data, exclude_none=True)
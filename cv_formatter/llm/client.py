@@ -0,0 +1,22 @@
+"""
+[MODULE: LLM CLIENT POOL]
+Role: The 'Switchboard'.
+Responsibility: Hand out shared OpenAI clients instead of building one per service instance.
+Flow: Service __init__ -> get_openai_client(api_key, base_url) -> cached OpenAI client.
+Logic:
+- Building an OpenAI client creates its own HTTP client, TLS context and connection pool.
+- Caching by (api_key, base_url) lets keep-alive connections be reused across CVs,
+  so only the first request pays the TCP/TLS handshake.
+Warning: Only the sync client is cached. Async clients are bound to the event loop
+that opened their connections, so they stay per-instance.
+"""
+import functools
+from openai import OpenAI
+
+@functools.lru_cache(maxsize=4)
+def get_openai_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    Returns a process-wide OpenAI client for the given credentials/provider.
+    Structuring and Enrichment may use different keys, hence a small cache, not a single slot.
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
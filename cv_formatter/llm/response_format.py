@@ -0,0 +1,88 @@
+"""
+[MODULE: RESPONSE FORMAT CACHE]
+Role: Schema Compiler.
+Responsibility: Build the strict JSON-Schema 'response_format' for a Pydantic model ONCE per process.
+Flow: Pydantic Model -> Strict JSON Schema (cached) -> chat.completions.create(response_format=...)
+Logic:
+- 'beta.chat.completions.parse(response_format=Model)' re-walks 'Model' into a JSON Schema on
+  every call. For stable schemas that is wasted CPU, so we precompute the dict and reuse it.
+- Strict mode rules (see _strictify) are applied locally, so no private SDK import is needed.
+- The raw completion content is then validated with 'Model.model_validate_json' (pydantic-core).
+Warning: The cache is keyed by class. If a model is redefined at runtime, call get_response_format.cache_clear().
+"""
+import functools
+from typing import Type, TypeVar
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+@functools.lru_cache(maxsize=None)
+def get_response_format(model_cls: Type[BaseModel]) -> dict:
+    """
+    Returns the strict 'response_format' dict for 'model_cls', computed once and cached.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model_cls.__name__,
+            "schema": _strictify(model_cls.model_json_schema()),
+            "strict": True,
+        },
+    }
+
+def _strictify(schema: dict, root: dict = None) -> dict:
+    """
+    Rewrites a Pydantic JSON Schema (in place) into what Structured Outputs' strict mode accepts:
+    - every object: 'additionalProperties: false' and ALL properties listed in 'required'
+      (optional fields stay nullable through their 'anyOf [..., null]', they just can't be omitted);
+    - 'default: null' dropped; a '$ref' with sibling keys (e.g. a description) inlined.
+    Local on purpose: the SDK's equivalent lives in a private module that moves between releases.
+    """
+    root = schema if root is None else root
+
+    for sub in (schema.get("$defs") or {}).values():
+        _strictify(sub, root)
+
+    if schema.get("type") == "object":
+        schema.setdefault("additionalProperties", False)
+
+    properties = schema.get("properties")
+    if isinstance(properties, dict):
+        schema["required"] = list(properties)
+        for prop in properties.values():
+            _strictify(prop, root)
+
+    if isinstance(schema.get("items"), dict):
+        _strictify(schema["items"], root)
+
+    for key in ("anyOf", "allOf"):
+        for variant in schema.get(key) or ():
+            _strictify(variant, root)
+    if len(schema.get("allOf") or ()) == 1:
+        schema.update(schema.pop("allOf")[0])
+
+    if "default" in schema and schema["default"] is None:
+        del schema["default"]
+
+    ref = schema.get("$ref")
+    if ref and len(schema) > 1:
+        # '#/$defs/Name' -> inline the definition, keeping the sibling keys (description...)
+        resolved = root
+        for part in ref[2:].split("/"):
+            resolved = resolved[part]
+        del schema["$ref"]
+        for key, value in resolved.items():
+            schema.setdefault(key, value)
+        return _strictify(schema, root)
+
+    return schema
+
+def parse_completion(model_cls: Type[ModelT], completion) -> ModelT:
+    """
+    Validates the first choice of a raw completion into 'model_cls'.
+    Raises ValueError on refusals/empty content so callers can route to their fallback.
+    """
+    message = completion.choices[0].message
+    if getattr(message, "refusal", None) or not message.content:
+        raise ValueError(f"Model returned no parsable content (refusal={getattr(message, 'refusal', None)})")
+    return model_cls.model_validate_json(message.content)
@@ -0,0 +1,44 @@
+"""
+[MODULE: LLM RETRY POLICY]
+Role: The 'Patience Budget'.
+Responsibility: One retry policy shared by every LLM caller (Structurer, Enrichment).
+Flow: call -> transient error? -> sleep(backoff(attempt)) -> call again (up to MAX_ATTEMPTS).
+Logic:
+- Inline loops at the call sites, not a decorator framework: the happy path is one network
+  call and should not pay for retry-state objects (or for importing 'tenacity' at boot).
+- Only TRANSIENT_ERRORS are retried (network blips, 429, 5xx). Anything else (400 schema
+  errors, auth, validation) would fail again identically.
+- A 429 that carries a 'Retry-After' header waits what the server asked for, not a guess.
+"""
+import random
+from typing import Optional
+from openai import APIConnectionError, APITimeoutError, RateLimitError, InternalServerError
+
+TRANSIENT_ERRORS = (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)
+
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 15.0
+
+def backoff(attempt: int, error: Optional[BaseException] = None) -> float:
+    """
+    Exponential backoff with a little jitter: ~1s, ~2s, ~4s ... capped.
+    If 'error' carries the server's 'Retry-After' hint (seconds), that wins (same cap).
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(BACKOFF_CAP, retry_after)
+    return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) + random.random() * 0.1
+
+def _retry_after(error: Optional[BaseException]) -> Optional[float]:
+    """Seconds from a 'Retry-After' header on the error's HTTP response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        seconds = float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        # Absent, or the HTTP-date form: fall back to exponential backoff
+        return None
+    return seconds if seconds >= 0 else None
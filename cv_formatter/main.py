@@ -9,19 +9,39 @@ Flow:
     4. Call Tagger (Analyze/Structure).
     5. Return Final JSON.
 Design Pattern: Facade. Clients (CLI, API) only interact with 'CVProcessor', hiding complexity.
+Batch: 'process_batch' runs N CVs on a thread pool. Each CV spends most of its wall time waiting
+on two LLM round-trips (structure + enrich), which release the GIL, so threads overlap them.
+Services: ATS, Structurer and Enrichment are built once per CVProcessor (on first use) and
+shared by every CV it processes, instead of rebuilding clients/caches for each document.
 """
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import List, Optional
+import os
 import time
 from cv_formatter.etl.cleaner import clean_text
 from cv_formatter.etl.triage import TriageDaemon
 from cv_formatter.formatter.json_formatter import format_to_dict
-from cv_formatter.utils.logging_config import setup_logging, get_logger
-from cv_formatter.utils.logging_config import setup_logging, get_logger
-import json
+from cv_formatter.utils.logging_config import get_logger
 
 # setup_logging() should be called by the application entry point (e.g., run_demo.py)
 logger = get_logger(__name__)
 
+def _dedupe_skills(skills: List[str]) -> List[str]:
+    """
+    Drops case/whitespace duplicates ('Python', 'python ') keeping the first spelling and the
+    LLM's order. One pass with a set of canonical keys, no sort and no extra list copies.
+    """
+    seen = set()
+    unique = []
+    for skill in skills:
+        skill = skill.strip()
+        key = skill.casefold()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(skill)
+    return unique
+
 class CVProcessor:
     """
     Facade to process a CV from raw text to structured JSON.
@@ -31,6 +51,26 @@ class CVProcessor:
     
     def __init__(self):
         self.triage_daemon = TriageDaemon()
+
+    # --- SHARED SERVICES (lazy) ---
+    # Built on first use, then reused: each Structurer/Enrichment instance opens an
+    # AsyncOpenAI client (own HTTP pool + TLS context) and a cache handle. Imports stay
+    # lazy so a CVProcessor can be created without touching the LLM stack.
+
+    @functools.cached_property
+    def ats_checker(self):
+        from cv_formatter.etl.ats_checker import ATSChecker
+        return ATSChecker()
+
+    @functools.cached_property
+    def structurer(self):
+        from cv_formatter.etl.semantic_structurer import SemanticStructurer
+        return SemanticStructurer()
+
+    @functools.cached_property
+    def enricher(self):
+        from cv_formatter.enricher.engine import EnrichmentService
+        return EnrichmentService()
     
     def process_cv(self, raw_text: str) -> dict:
         """
@@ -48,9 +88,7 @@ class CVProcessor:
             logger.info(f"Triage Accepted. Language: {meta_context.get('language', 'es')}")
             
             # --- STEP 0.5: ATS (Audit) ---
-            from cv_formatter.etl.ats_checker import ATSChecker
-            ats_checker = ATSChecker()
-            ats_result = ats_checker.check(raw_text)
+            ats_result = self.ats_checker.check(raw_text)
             
             # --- STEP 1: CLEANING ---
             cleaned_text = clean_text(raw_text)
@@ -59,18 +97,14 @@ class CVProcessor:
             # Radical Simplification: LLM extracts full structure directly.
             logger.info("Step 2: One-Shot Semantic Structurer...")
             
-            from cv_formatter.etl.semantic_structurer import SemanticStructurer
-            structurer = SemanticStructurer()
-            
             try:
-                extracted_data = structurer.extract_structure(cleaned_text)
+                extracted_data = self.structurer.extract_structure(cleaned_text)
             except Exception as e:
                 logger.error(f"Semantic Structuring failed: {e}")
                 raise ValueError(f"Semantic Structuring failed: {e}")
             
             # --- STEP 3: CONVERT TO CVData FORMAT ---
             from cv_formatter.formatter.json_formatter import CVData, ExperienceEntry, EducationEntry, CertificationEntry
-            import uuid
 
             logger.info(f"Mapping extracted data to CVData...")
             
@@ -81,7 +115,6 @@ class CVProcessor:
                 desc_text = exp.description if exp.description else "\n".join(exp.description_bullets)
                 
                 entry = ExperienceEntry(
-                    id=str(uuid.uuid4()),
                     company=exp.company or "Unknown",
                     title=exp.title or "Unknown",
                     start_date=exp.start_date,
@@ -114,8 +147,8 @@ class CVProcessor:
                 
             # 3.4 Skills (Direct mapping)
             final_skills = {
-                "hard_skills": extracted_data.skills.hard_skills,
-                "soft_skills": extracted_data.skills.soft_skills,
+                "hard_skills": _dedupe_skills(extracted_data.skills.hard_skills),
+                "soft_skills": _dedupe_skills(extracted_data.skills.soft_skills),
                 "languages": extracted_data.skills.languages
             }
             
@@ -151,7 +184,6 @@ class CVProcessor:
 
             # --- STEP 3: ASSEMBLE ---
             cv_data = CVData(
-                id=str(uuid.uuid4()),
                 full_name=final_name,
                 summary=final_summary,
                 experience=experience_entries,
@@ -175,13 +207,9 @@ class CVProcessor:
             enrichment_json = None
             
             try:
-                from cv_formatter.enricher.engine import EnrichmentService
-                enricher = EnrichmentService()
-                
-                # Get ID from source
-                cv_id = final_json.get('id')
-                
-                enrichment_obj = enricher.enrich_cv(final_json, cv_id)
+                # Hand over the validated model, not final_json: the dict would be
+                # re-validated into CVData (every entry, every check_dates) just for the timeline.
+                enrichment_obj = self.enricher.enrich_cv(cv_data, cv_data.id)
                 enrichment_json = enrichment_obj.model_dump(exclude_none=True) if enrichment_obj else None
                 
             except Exception as e:
@@ -203,6 +231,37 @@ class CVProcessor:
             logger.error(f"Pipeline Fatal Error: {str(e)}", exc_info=True)
             raise e
 
+    def process_batch(self, raw_texts: List[str], max_workers: Optional[int] = None) -> List[Optional[dict]]:
+        """
+        Processes many CVs concurrently. Results keep the input order.
+        Soft-fail per CV: a rejected/failed document yields None instead of aborting the batch.
+        """
+        if not raw_texts:
+            return []
+
+        # Lazy shared state (langdetect profiles, services) is built ONCE here, not raced by N workers.
+        # (cached_property has no lock on 3.12+: N workers would each build their own AsyncOpenAI.)
+        from cv_formatter.etl.triage import get_detector_factory
+        get_detector_factory()
+        try:
+            self.ats_checker, self.structurer, self.enricher
+        except Exception as e:
+            # Not fatal here: each CV retries the missing service and soft-fails on its own.
+            logger.warning(f"Batch warm-up incomplete: {e}")
+
+        workers = max_workers or min(len(raw_texts), (os.cpu_count() or 1) * 4)
+        logger.info(f"Batch: processing {len(raw_texts)} CVs with {workers} workers...")
+
+        def _safe_process(raw_text: str) -> Optional[dict]:
+            try:
+                return self.process_cv(raw_text)
+            except Exception as e:
+                logger.warning(f"Batch item failed: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_safe_process, raw_texts))
+
 # Simple usage example if run directly
 if __name__ == "__main__":
     pass
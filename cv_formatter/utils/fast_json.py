@@ -0,0 +1,27 @@
+"""
+[MODULE: FAST JSON]
+Role: Serialization Helper.
+Responsibility: Compact JSON encoding for payloads sent to the LLM (and cache keys).
+Flow: dict -> orjson (C/Rust) -> compact UTF-8 string.
+Logic:
+- Uses 'orjson' when available (~3-5x faster than stdlib 'json' on nested CV dicts).
+- Falls back to stdlib 'json' with compact separators, so output shape is the same.
+- Output is compact (no spaces after ',' / ':') and non-ASCII is kept as-is:
+  fewer bytes -> fewer prompt tokens.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_bytes(obj) -> bytes:
+    """Serializes 'obj' to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def dumps(obj) -> str:
+    """Serializes 'obj' to a compact JSON string."""
+    return dumps_bytes(obj).decode("utf-8")
@@ -0,0 +1,64 @@
+"""
+[MODULE: RESULT CACHE]
+Role: The 'Memory'.
+Responsibility: Persist expensive LLM results on disk, keyed by a hash of their inputs.
+Flow: Inputs -> make_key() (blake2b) -> <dir>/<k[:2]>/<key>.json -> get()/set().
+Logic:
+- Content-addressed: same input (+ model + prompt version) => same key => O(1) lookup
+  instead of a multi-second, billed LLM round-trip.
+- Entries expire after 'ttl_seconds' (checked against file mtime).
+- Writes are atomic (temp file + os.replace), so concurrent workers never read half a file.
+Warning: The cache is best-effort. Any I/O error is logged and treated as a miss.
+"""
+import hashlib
+import os
+import tempfile
+import time
+from typing import Optional
+
+from cv_formatter.utils import fast_json
+from cv_formatter.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+class ResultCache:
+    """
+    Tiny file-per-key cache (stdlib only, no server).
+    Values are strings (typically 'Model.model_dump_json()').
+    """
+
+    def __init__(self, directory: str, ttl_seconds: Optional[float] = None):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Stable 128-bit hex key for any JSON-serializable parts."""
+        return hashlib.blake2b(fast_json.dumps_bytes(list(parts)), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if self.ttl_seconds is not None and time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
@@ -6,11 +6,25 @@ Flow: Text -> Encoding (Tiktoken) -> Integer Count -> Cost Estimation.
 Logic:
 - Uses 'tiktoken' to replicate GPT/LLM tokenization rules locally.
 - Provides 'estimate_cost' based on configurable pricing (defaulting to GPT-4o-mini rates).
+- The encoding for a model is resolved ONCE and cached: tokenizing is the only per-call work.
 Warning: Pricing is hardcoded ($0.15/$0.60 per 1M). outcomes may vary if model changes.
 """
+import functools
 import tiktoken
 import logging
 
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Resolves (and caches) the tiktoken encoding for 'model'.
+    Unknown models (Gemma, fine-tunes) used to raise + catch a KeyError on EVERY count; now only once.
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback for newer models or fine-tuned variants
+        return tiktoken.get_encoding("cl100k_base")
+
 def count_tokens(text: str, model: str = "gpt-4o") -> int:
     """
     Returns the exact number of tokens in a text string for a given model.
@@ -20,14 +34,7 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
     - Fallbacks to 'cl100k_base' (standard for GPT-3.5/4) if model is unknown.
     - This is crucial for Pre-flight checks (preventing Context Window errors).
     """
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # Fallback for newer models or fine-tuned variants
-        encoding = tiktoken.get_encoding("cl100k_base")
-        
-    num_tokens = len(encoding.encode(text))
-    return num_tokens
+    return len(_get_encoding(model).encode(text))
 
 def estimate_cost(input_tokens: int, output_tokens: int, model: str = "gpt-4o-mini") -> float:
     """
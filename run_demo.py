@@ -11,6 +11,8 @@ Logic:
 import sys
 import os
 import json
+import re
+from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -21,9 +23,14 @@ import pyperclip
 # Append path ensuring backend modules are found
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Pre-flight: load .env/Config at boot, not during the first CV
+import cv_formatter._bootstrap
 from cv_formatter.main import CVProcessor
 from cv_formatter.utils.logging_config import setup_logging
 
+# Filename sanitizer, compiled once at import (not looked up in re's cache on every save)
+_UNSAFE_FILENAME_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
 def json_to_markdown(data: dict) -> str:
     """Converts the CV JSON into a clean Markdown representation."""
     md = f"# {data.get('full_name', 'Unknown Candidate')}\n\n"
@@ -207,15 +214,13 @@ def main():
                 console.print(ats_panel)
 
             # Generate dynamic filename
-            import re
-            from datetime import datetime
-            
             # Extract candidate name safe for filename
             raw_name = cv_data.get('full_name', 'Unknown_Candidate')
             # 1. Replace one or more spaces with a SINGLE underscore
-            safe_name = re.sub(r'\s+', '_', raw_name.strip())
+            # (split() drops leading/trailing whitespace and collapses runs, no regex needed)
+            safe_name = '_'.join(raw_name.split())
             # 2. Remove any remaining non-alphanumeric chars (except underscore and dash)
-            safe_name = re.sub(r'[^a-zA-Z0-9_-]', '', safe_name)
+            safe_name = _UNSAFE_FILENAME_RE.sub('', safe_name)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Ensure output directory exists
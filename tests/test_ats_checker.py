@@ -26,6 +26,24 @@ def test_emojis_penalty(ats_checker):
     assert "Found 2 emojis/icons" in result.issues[0]
     assert result.score < 100
 
+def test_emoji_sequences_count_once(ats_checker):
+    text = "Experience Education Skills 👍🏽 👨\u200d👩\u200d👧 🇨🇱"
+    result = ats_checker.check(text)
+    assert "Found 3 emojis/icons" in result.issues[0]
+    assert result.score == 94
+
+def test_decorative_cv_bullets_are_not_emojis(ats_checker):
+    text = "Experience\n✦ Python\n✦ SQL\n❖ Docker\n❖ AWS\nEducation\nSkills"
+    result = ats_checker.check(text)
+    assert result.issues == []
+    assert result.score == 100
+
+def test_symbol_emojis_are_counted(ats_checker):
+    text = "Experience Education Skills 🆗 #\ufe0f\u20e3"
+    result = ats_checker.check(text)
+    assert "Found 2 emojis/icons" in result.issues[0]
+    assert result.score == 96
+
 def test_weird_bullets_penalty(ats_checker):
     text = """
     Experience
@@ -46,3 +64,16 @@ def test_missing_sections(ats_checker):
     assert "Experience/Experience" in result.missing_sections
     assert "Skills/Habilidades" in result.missing_sections
     assert result.score <= 60
+
+def test_spanish_sections_any_case(ats_checker):
+    text = "TRAYECTORIA PROFESIONAL\nDev\nFORMACIÓN ACADÉMICA\nIngeniería\nHabilidades\nPython"
+    result = ats_checker.check(text)
+    assert result.missing_sections == []
+    assert result.score == 100
+
+def test_repeated_check_returns_independent_copies(ats_checker):
+    first = ats_checker.check("Just a name")
+    first.issues.append("mutated by caller")
+    second = ats_checker.check("Just a name")
+    assert "mutated by caller" not in second.issues
+    assert second.missing_sections == first.missing_sections
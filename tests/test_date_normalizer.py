@@ -0,0 +1,77 @@
+"""
+[TEST: DATE NORMALIZER]
+Tests para la normalización de fechas (YYYY-MM / YYYY / Present).
+"""
+from datetime import date
+from cv_formatter.utils.date_normalizer import DateNormalizer
+
+
+def test_month_name_glued_to_year():
+    assert DateNormalizer.normalize("Marzo 2023") == "2023-03"
+    assert DateNormalizer.normalize("Dec 2021") == "2021-12"
+
+def test_month_name_separated_from_year():
+    # "Mes de Año" is the usual Spanish long form; the month must not be lost to 'de'/'del'.
+    assert DateNormalizer.normalize("Marzo de 2023") == "2023-03"
+    assert DateNormalizer.normalize("Junio de 2018") == "2018-06"
+    assert DateNormalizer.normalize("Septiembre del 2020") == "2020-09"
+
+def test_month_name_is_a_whole_word():
+    assert DateNormalizer.normalize("Marketing 2020") == "2020"
+    assert DateNormalizer.normalize("Proyecto de 2020") == "2020"
+    assert DateNormalizer.normalize("2020 marzo") == "2020"
+
+def test_parse_to_date():
+    assert DateNormalizer.parse_to_date("2020-05") == date(2020, 5, 1)
+    assert DateNormalizer.parse_to_date("2019") == date(2019, 1, 1)
+    assert DateNormalizer.parse_to_date("Presente") == date.today()
+    assert DateNormalizer.parse_to_date("", is_end_date=True) == date.today()
+    assert DateNormalizer.parse_to_date("") is None
+
+def test_extract_range():
+    assert DateNormalizer.extract_range("Mar 2023 - Ago 2025") == ("2023-03", "2025-08")
+    assert DateNormalizer.extract_range("Enero 2022 - Actualidad") == ("2022-01", "Present")
+    assert DateNormalizer.extract_range("Backend Developer at ACME") == ("Unknown", "Unknown")
+
+def test_parse_to_month_index():
+    from cv_formatter.utils.date_normalizer import month_index_to_date
+    assert DateNormalizer.parse_to_month_index("2021-03") - DateNormalizer.parse_to_month_index("2020-01") == 14
+    assert month_index_to_date(DateNormalizer.parse_to_month_index("Dic 2019")) == date(2019, 12, 1)
+    assert DateNormalizer.parse_to_month_index("") is None
+
+def test_invalid_month_is_rejected():
+    assert DateNormalizer.parse_to_date("2020-13") is None
+
+def test_present_markers():
+    assert DateNormalizer.normalize("Presente") == "Present"
+    assert DateNormalizer.normalize("ACTUALIDAD") == "Present"
+    assert DateNormalizer.extract_range("2021 - Current") == ("2021", "Present")
+    assert DateNormalizer.parse_to_month_index("Present", is_end_date=True, today_index=42) == 42
+
+def test_normalize_parts_uses_captured_groups():
+    assert DateNormalizer.normalize_parts("Marzo", "2023") == "2023-03"
+    assert DateNormalizer.normalize_parts("Presente", "2023") == "Present"
+    assert DateNormalizer.normalize_parts("Python", "2023") == "2023"
+    assert DateNormalizer.normalize_parts(None, "2023") == "2023"
+
+def test_extract_range_month_glued_to_year():
+    assert DateNormalizer.extract_range("Ene2020 - Mar 2021") == ("2020-01", "2021-03")
+    assert DateNormalizer.extract_range("03/2020 - 2021") == ("2020-03", "2021")
+
+def test_text_without_year_is_returned_as_is():
+    assert DateNormalizer.normalize("Marzo") == "Marzo"
+    assert DateNormalizer.normalize("03/23") == "03/23"
+
+def test_year_zero_is_rejected_not_raised():
+    assert DateNormalizer.parse_to_date("0000-01") is None
+    assert DateNormalizer.parse_to_date("01/0000") is None
+    assert DateNormalizer.parse_to_month_index("0000-01") is None
+
+def test_timeline_sort_survives_year_zero():
+    from cv_formatter.formatter.json_formatter import CVData, ExperienceEntry
+    from cv_formatter.utils.timeline_sorter import TimelineSorter
+    cv = CVData(experience=[
+        ExperienceEntry(title="A", start_date="0000-01", end_date="0000"),
+        ExperienceEntry(title="B", start_date="2020-01", end_date="2021-01"),
+    ])
+    assert [e.title for e in TimelineSorter.sort(cv).experience] == ["B", "A"]
@@ -99,3 +99,15 @@ Marzo 2019 - Diciembre 2021
         dates_found = [(h.start_date, h.end_date) for h in date_hints]
         assert ("2022-01", "Present") in dates_found
         assert ("2019-03", "2021-12") in dates_found
+
+def test_phone_numbers_are_not_dates():
+    hints = DatePreProcessor().extract_all_dates("Contacto\nTel 56912345678\nMarzo2019")
+    assert 1 not in hints
+    assert hints[2].start_date == "2019-03"
+
+def test_non_month_word_is_not_medium_confidence():
+    hints = DatePreProcessor().extract_all_dates("Python 2023\nCertificado Marzo 2019")
+    assert hints[0].start_date == "2023"
+    assert hints[0].confidence == "low"
+    assert hints[1].start_date == "2019-03"
+    assert hints[1].confidence == "medium"
@@ -0,0 +1,201 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from cv_formatter.enricher.schemas import EnrichmentData
+
+def _completion(parsed):
+    completion = MagicMock()
+    completion.choices = [MagicMock()]
+    completion.choices[0].message.content = parsed.model_dump_json()
+    completion.choices[0].message.refusal = None
+    return completion
+
+@pytest.fixture
+def enricher(tmp_path):
+    from cv_formatter.utils.result_cache import ResultCache
+    with patch('cv_formatter.enricher.engine.get_openai_client'), patch('cv_formatter.enricher.engine.AsyncOpenAI'):
+        from cv_formatter.enricher.engine import EnrichmentService
+        service = EnrichmentService(concurrency=2)
+    service.cache = ResultCache(str(tmp_path))
+    return service
+
+def test_enrich_many_keeps_order_and_ids(enricher):
+    enricher.async_client.chat.completions.create = AsyncMock(
+        side_effect=lambda **kw: _completion(EnrichmentData(target_cv_id="llm-made-up"))
+    )
+    items = [({"full_name": f"Candidate {i}"}, f"cv-{i}") for i in range(5)]
+
+    results = asyncio.run(enricher.enrich_many(items))
+
+    assert [r.target_cv_id for r in results] == [f"cv-{i}" for i in range(5)]
+    assert enricher.async_client.chat.completions.create.await_count == 5
+
+def test_enrich_many_soft_fails_per_item(enricher):
+    async def flaky(**kw):
+        if "Broken" in kw["messages"][1]["content"]:
+            raise RuntimeError("boom")
+        return _completion(EnrichmentData(target_cv_id="x"))
+
+    enricher.async_client.chat.completions.create = AsyncMock(side_effect=flaky)
+    items = [({"full_name": "Ok"}, "cv-ok"), ({"full_name": "Broken"}, "cv-broken")]
+
+    results = asyncio.run(enricher.enrich_many(items))
+
+    assert results[0].target_cv_id == "cv-ok"
+    assert results[1] is None
+
+def test_response_format_is_built_once():
+    from cv_formatter.llm.response_format import get_response_format
+    fmt = get_response_format(EnrichmentData)
+    assert fmt["type"] == "json_schema"
+    assert fmt["json_schema"]["name"] == "EnrichmentData"
+    assert get_response_format(EnrichmentData) is fmt
+
+def test_response_format_is_strict():
+    from cv_formatter.llm.response_format import get_response_format
+    from cv_formatter.etl.semantic_structurer import ExtractedCV
+    fmt = get_response_format(ExtractedCV)
+    assert fmt["json_schema"]["strict"] is True
+
+    def walk(node):
+        if isinstance(node, dict):
+            if node.get("type") == "object":
+                assert node["additionalProperties"] is False
+                assert node["required"] == list(node["properties"])
+            assert node.get("default", "unset") is not None
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(fmt["json_schema"]["schema"])
+
+def test_enrich_cv_accepts_cvdata(enricher):
+    from cv_formatter.formatter.json_formatter import CVData, ExperienceEntry
+    enricher.client.chat.completions.create = MagicMock(
+        return_value=_completion(EnrichmentData(target_cv_id="x"))
+    )
+    cv = CVData(full_name="Ana", experience=[ExperienceEntry(title="Dev", start_date="2020-01", end_date="2022-01")])
+
+    result = enricher.enrich_cv(cv, "cv-ana")
+
+    assert result.target_cv_id == "cv-ana"
+    assert result.timeline_analysis.total_years_experience == 2.0
+    user_msg = enricher.client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert '"full_name":"Ana"' in user_msg
+
+def test_permanent_error_skips_retries_and_uses_fallback(enricher):
+    calls = []
+    def create(**kw):
+        calls.append(kw["model"])
+        if kw["model"] == enricher.model:
+            raise ValueError("400: schema rejected")
+        return _completion(EnrichmentData(target_cv_id="x"))
+
+    enricher.model = "primary-model"
+    enricher.client.chat.completions.create = MagicMock(side_effect=create)
+
+    result = enricher.enrich_cv({"full_name": "Ana"}, "cv-ana")
+
+    assert result.target_cv_id == "cv-ana"
+    assert calls[0] == "primary-model"
+    assert len(calls) == 2  # primary once (no backoff), then fallback
+
+    # Fallback answers are not cached under the primary's key: the next run tries the primary again.
+    enricher.enrich_cv({"full_name": "Ana"}, "cv-ana")
+    assert calls[2] == "primary-model"
+
+def test_hedged_fallback_wins_when_primary_is_slow(enricher, monkeypatch):
+    from cv_formatter.config import config
+    monkeypatch.setattr(config, "ENRICH_HEDGE_DELAY", 0.01)
+    enricher.model = "slow-primary"
+
+    async def create(**kw):
+        if kw["model"] == "slow-primary":
+            await asyncio.sleep(5)
+        return _completion(EnrichmentData(target_cv_id="x", market_signals={"stack_detected": [kw["model"]]}))
+
+    enricher.async_client.chat.completions.create = AsyncMock(side_effect=create)
+
+    result = asyncio.run(asyncio.wait_for(enricher.enrich_cv_async({"full_name": "Ana"}, "cv-ana"), timeout=2))
+
+    assert result.target_cv_id == "cv-ana"
+    assert result.market_signals.stack_detected == [config.MODEL_STRUCTURE]
+    assert enricher.cache.get(enricher._prepare({"full_name": "Ana"}).cache_key) is None
+
+def test_payload_is_projected_to_enrichment_fields(enricher):
+    cv_json = {
+        "id": "abc", "full_name": "Ana", "email": "ana@example.com", "phone": "+56 9 1234",
+        "ats_analysis": {"score": 90}, "raw_text": "FULL RAW TEXT",
+        "skills": {"hard_skills": ["Python"], "soft_skills": []},
+        "experience": [{"id": "e1", "title": "Dev", "company": "ACME", "start_date": "2020-01",
+                        "date_confidence": "high", "user_adjusted": False}],
+    }
+    slim = enricher._slim_payload(cv_json)
+
+    assert set(slim) == {"full_name", "skills", "experience"}
+    assert slim["experience"] == [{"title": "Dev", "company": "ACME", "start_date": "2020-01"}]
+
+def test_payload_keeps_raw_text_when_skills_missing(enricher):
+    slim = enricher._slim_payload({"full_name": "Ana", "skills": {"hard_skills": []}, "raw_text": "Jira, Zendesk"})
+    assert slim["raw_text"] == "Jira, Zendesk"
+
+def test_async_primary_answer_is_cached(enricher):
+    enricher.async_client.chat.completions.create = AsyncMock(return_value=_completion(EnrichmentData(target_cv_id="x")))
+
+    asyncio.run(enricher.enrich_cv_async({"full_name": "Ana"}, "cv-ana"))
+
+    assert enricher.cache.get(enricher._prepare({"full_name": "Ana"}).cache_key) is not None
+
+def test_second_enrichment_is_served_from_cache(enricher):
+    enricher.client.chat.completions.create = MagicMock(
+        return_value=_completion(EnrichmentData(target_cv_id="x", market_signals={"stack_detected": ["Python"]}))
+    )
+    cv_json = {"full_name": "Ana", "skills": {"hard_skills": ["Python"]}}
+
+    first = enricher.enrich_cv(cv_json, "cv-1")
+    second = enricher.enrich_cv(cv_json, "cv-2")
+
+    assert enricher.client.chat.completions.create.call_count == 1
+    assert second.market_signals.stack_detected == first.market_signals.stack_detected
+    assert second.target_cv_id == "cv-2"
+
+def test_enrich_batch_packs_cvs_and_reassigns_ids(enricher):
+    from cv_formatter.enricher.schemas import EnrichmentBatch
+    batch = EnrichmentBatch(results=[EnrichmentData(target_cv_id="?") for _ in range(3)])
+    enricher.client.chat.completions.create = MagicMock(return_value=_completion(batch))
+    items = [({"full_name": f"Candidate {i}"}, f"cv-{i}") for i in range(3)]
+
+    results = enricher.enrich_batch(items, batch_size=3)
+
+    assert enricher.client.chat.completions.create.call_count == 1
+    assert [r.target_cv_id for r in results] == ["cv-0", "cv-1", "cv-2"]
+
+def test_enrich_batch_falls_back_on_count_mismatch(enricher):
+    from cv_formatter.enricher.schemas import EnrichmentBatch
+    def create(**kw):
+        if kw["response_format"]["json_schema"]["name"] == "EnrichmentBatch":
+            return _completion(EnrichmentBatch(results=[EnrichmentData(target_cv_id="?")]))
+        return _completion(EnrichmentData(target_cv_id="?"))
+    enricher.client.chat.completions.create = MagicMock(side_effect=create)
+    items = [({"full_name": f"Candidate {i}"}, f"cv-{i}") for i in range(2)]
+
+    with patch.object(enricher, "_prepare", wraps=enricher._prepare) as prepare:
+        results = enricher.enrich_batch(items, batch_size=2)
+
+    assert [r.target_cv_id for r in results] == ["cv-0", "cv-1"]
+    assert enricher.client.chat.completions.create.call_count == 3
+    assert prepare.call_count == 2  # the per-CV fallback reuses the prepared payloads
+
+def test_transient_error_is_retried_inline(enricher, monkeypatch):
+    from openai import APITimeoutError
+    monkeypatch.setattr("cv_formatter.enricher.engine.time.sleep", lambda s: None)
+    enricher.client.chat.completions.create = MagicMock(
+        side_effect=[APITimeoutError(request=MagicMock()), _completion(EnrichmentData(target_cv_id="x"))]
+    )
+
+    result = enricher.enrich_cv({"full_name": "Ana"}, "cv-ana")
+
+    assert result.target_cv_id == "cv-ana"
+    assert enricher.client.chat.completions.create.call_count == 2
@@ -12,3 +12,8 @@ def test_clean_text_newlines():
     raw_text = "Line 1\n\n\nLine 2"
     expected = "Line 1\n\nLine 2"
     assert clean_text(raw_text) == expected
+
+def test_clean_text_line_bullets_and_tabs():
+    raw_text = "Skills:\n   *   Python\t\tSQL\n* Docker ➤ K8s"
+    expected = "Skills:\n- Python SQL\n- Docker - K8s"
+    assert clean_text(raw_text) == expected
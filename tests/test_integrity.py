@@ -50,3 +50,99 @@ def test_no_inferred_data_in_cv(cv_data: CVData):
 # @pytest.fixture
 # def sample_result():
 #     return process_cv_files(sample_path)
+
+def test_process_batch_keeps_order_and_soft_fails():
+    from unittest.mock import patch
+    from cv_formatter.main import CVProcessor
+
+    def fake_process(raw_text):
+        if raw_text == "bad":
+            raise ValueError("Document rejected")
+        return {"source_cv": {"full_name": raw_text}, "enrichment": None}
+
+    processor = CVProcessor()
+    with patch.object(processor, "process_cv", side_effect=fake_process):
+        results = processor.process_batch(["a", "bad", "c"], max_workers=3)
+
+    assert [r and r["source_cv"]["full_name"] for r in results] == ["a", None, "c"]
+
+def test_ids_are_unique_uuid4_strings():
+    import uuid
+    from cv_formatter.formatter.json_formatter import ExperienceEntry
+    ids = {ExperienceEntry(title="Dev").id for _ in range(1000)}
+    assert len(ids) == 1000
+    assert all(uuid.UUID(i).version == 4 for i in ids)
+
+def test_format_to_json_matches_format_to_dict():
+    # Built locally (no cv_data fixture): runs offline, without OPENAI_API_KEY.
+    from cv_formatter.formatter.json_formatter import (
+        ATSAnalysis, EducationEntry, ExperienceEntry, SkillSection, format_to_dict, format_to_json
+    )
+    cv = CVData(
+        full_name="Ana Pérez",
+        experience=[ExperienceEntry(title="Dev", company="ACME", start_date="2020-01", end_date="Present")],
+        education=[EducationEntry(degree="Ingeniería", institution="UCh")],
+        skills=SkillSection(hard_skills=["Python"], soft_skills=["Liderazgo"]),
+        ats_analysis=ATSAnalysis(score=90, issues=["Emojis"]),
+    )
+    assert json.loads(format_to_json(cv)) == format_to_dict(cv)
+
+def test_skills_are_deduplicated_case_insensitively():
+    from cv_formatter.main import _dedupe_skills
+    assert _dedupe_skills(["Python", "SQL", "python ", " sql", "", "Docker"]) == ["Python", "SQL", "Docker"]
+
+def test_check_dates_fallback_reads_across_fields():
+    from cv_formatter.formatter.json_formatter import ExperienceEntry
+    undated = ExperienceEntry(title="Dev", company="Acme", description="Backend work")
+    assert undated.start_date is None and undated.date_confidence == "high"
+
+    split = ExperienceEntry(title="Dev 2019", company="Acme", description="Still here, Present")
+    assert (split.start_date, split.end_date, split.date_confidence) == ("2019", "Present", "medium")
+
+def test_services_are_built_once_per_processor(raw_text):
+    from unittest.mock import patch, MagicMock
+    from cv_formatter.main import CVProcessor
+    from cv_formatter.etl.semantic_structurer import ExtractedCV
+
+    with patch('cv_formatter.etl.semantic_structurer.SemanticStructurer') as structurer_cls, \
+         patch('cv_formatter.enricher.engine.EnrichmentService') as enricher_cls:
+        structurer_cls.return_value.extract_structure.return_value = ExtractedCV(full_name="Juan Perez")
+        enricher_cls.return_value.enrich_cv.return_value = None
+        processor = CVProcessor()
+        processor.process_cv(raw_text)
+        processor.process_cv(raw_text)
+
+    assert structurer_cls.call_count == 1
+    assert enricher_cls.call_count == 1
+    assert structurer_cls.return_value.extract_structure.call_count == 2
+
+def test_json_formatter_imports_without_register_at_fork():
+    # Windows has no os.register_at_fork: the import must not depend on it.
+    # Fresh interpreter, so the already-imported models of this session are left untouched.
+    import os
+    import subprocess
+    import sys
+    code = (
+        "import os, uuid; del os.register_at_fork; "
+        "from cv_formatter.formatter.json_formatter import _new_id; "
+        "assert uuid.UUID(_new_id()).version == 4"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+def test_process_batch_builds_services_before_fan_out():
+    from unittest.mock import patch
+    from cv_formatter.main import CVProcessor
+
+    with patch('cv_formatter.etl.semantic_structurer.SemanticStructurer') as structurer_cls, \
+         patch('cv_formatter.enricher.engine.EnrichmentService') as enricher_cls:
+        processor = CVProcessor()
+        built_before_workers = []
+        def fake_process(raw_text):
+            built_before_workers.append(structurer_cls.call_count == 1 and enricher_cls.call_count == 1)
+            return {"source_cv": {}, "enrichment": None}
+
+        with patch.object(processor, "process_cv", side_effect=fake_process):
+            processor.process_batch(["a", "b", "c", "d"], max_workers=4)
+
+    assert built_before_workers == [True] * 4
+    assert structurer_cls.call_count == 1 and enricher_cls.call_count == 1
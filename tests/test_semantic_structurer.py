@@ -0,0 +1,133 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock, patch
+from cv_formatter.etl.semantic_structurer import ExtractedCV
+
+def _stream(parsed, size=16):
+    content = parsed.model_dump_json()
+    chunks = []
+    for i in range(0, len(content), size):
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = content[i:i + size]
+        chunks.append(chunk)
+    return iter(chunks)
+
+async def _astream(parsed, size=16):
+    for chunk in _stream(parsed, size):
+        yield chunk
+
+@pytest.fixture
+def structurer(tmp_path):
+    from cv_formatter.utils.result_cache import ResultCache
+    with patch('cv_formatter.etl.semantic_structurer.get_openai_client'), patch('cv_formatter.etl.semantic_structurer.AsyncOpenAI'):
+        from cv_formatter.etl.semantic_structurer import SemanticStructurer
+        service = SemanticStructurer(concurrency=2)
+    service.cache = ResultCache(str(tmp_path))
+    return service
+
+def test_extract_batch_keeps_order(structurer):
+    async def create(**kw):
+        return _astream(ExtractedCV(full_name=kw["messages"][1]["content"].rsplit("\n", 1)[-1]))
+
+    structurer.async_client.chat.completions.create = AsyncMock(side_effect=create)
+    texts = [f"Candidate {i}" for i in range(5)]
+
+    results = asyncio.run(structurer.extract_batch(texts))
+
+    assert [r.full_name for r in results] == texts
+    assert structurer.async_client.chat.completions.create.await_count == 5
+    assert structurer.async_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+def test_extract_batch_soft_fails_per_item(structurer):
+    async def create(**kw):
+        if "Broken" in kw["messages"][1]["content"]:
+            raise RuntimeError("boom")
+        return _astream(ExtractedCV(full_name="Ok"))
+
+    structurer.async_client.chat.completions.create = AsyncMock(side_effect=create)
+
+    results = asyncio.run(structurer.extract_batch(["Ok", "Broken"]))
+
+    assert results[0].full_name == "Ok"
+    assert results[1].experience == [] and results[1].full_name is None
+
+def test_same_text_is_served_from_cache(structurer):
+    structurer.client.chat.completions.create = MagicMock(
+        side_effect=lambda **kw: _stream(ExtractedCV(full_name="Ana"))
+    )
+
+    first = structurer.extract_structure("Ana CV")
+    second = structurer.extract_structure("Ana CV")
+
+    assert structurer.client.chat.completions.create.call_count == 1
+    assert first.full_name == "Ana"
+    assert second == first
+
+def test_failed_extraction_is_not_cached(structurer):
+    structurer.client.chat.completions.create = MagicMock(side_effect=RuntimeError("boom"))
+
+    structurer.extract_structure("Ana CV")
+    structurer.extract_structure("Ana CV")
+
+    assert structurer.client.chat.completions.create.call_count == 2
+
+def test_streamed_chunks_are_validated_once_complete(structurer):
+    cv = ExtractedCV(full_name="Ana", skills={"hard_skills": ["Python", "SQL"]})
+    structurer.client.chat.completions.create = MagicMock(return_value=_stream(cv, size=5))
+
+    result = structurer.extract_structure("Ana CV")
+
+    assert result == cv
+    assert structurer.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+def test_contact_only_lines_are_not_sent():
+    from cv_formatter.etl.semantic_structurer import _strip_contact_lines
+    text = (
+        "Ana Pérez\n"
+        "Email: ana@mail.com | Tel: +56 9 1234 5678\n"
+        "linkedin.com/in/ana\n"
+        "2019 - 2021\n"
+        "Contacto: ana@mail.com (preferido)\n"
+    )
+    assert _strip_contact_lines(text) == "Ana Pérez\n2019 - 2021\nContacto: ana@mail.com (preferido)\n"
+
+def test_year_columns_and_numbers_are_kept():
+    from cv_formatter.etl.semantic_structurer import _strip_contact_lines
+    text = "2019 2020 2021\n2010.2012.2014\n1200 1500 1800\n(2015) 2016 2017\n"
+    assert _strip_contact_lines(text) == text
+
+def test_project_and_company_urls_are_kept():
+    from cv_formatter.etl.semantic_structurer import _strip_contact_lines
+    text = "https://mi-proyecto.dev\nwww.empresa.cl\nPortfolio: https://ana.design\n"
+    assert _strip_contact_lines(text) == text
+
+def test_labeled_local_phone_is_dropped():
+    from cv_formatter.etl.semantic_structurer import _strip_contact_lines
+    assert _strip_contact_lines("Ana\nCelular: 9 1234 5678\nhttps://www.linkedin.com/in/ana\n") == "Ana\n"
+
+def test_transient_error_is_retried_inline(structurer, monkeypatch):
+    from openai import APITimeoutError
+    monkeypatch.setattr("cv_formatter.etl.semantic_structurer.time.sleep", lambda s: None)
+    structurer.client.chat.completions.create = MagicMock(
+        side_effect=[APITimeoutError(request=MagicMock()), _stream(ExtractedCV(full_name="Ana"))]
+    )
+
+    result = structurer.extract_structure("Ana CV")
+
+    assert result.full_name == "Ana"
+    assert structurer.client.chat.completions.create.call_count == 2
+
+def test_rate_limit_waits_for_retry_after(structurer, monkeypatch):
+    from openai import RateLimitError
+    sleeps = []
+    monkeypatch.setattr("cv_formatter.etl.semantic_structurer.time.sleep", sleeps.append)
+    response = MagicMock(status_code=429, headers={"retry-after": "3"})
+    structurer.client.chat.completions.create = MagicMock(
+        side_effect=[RateLimitError("slow down", response=response, body=None), _stream(ExtractedCV(full_name="Ana"))]
+    )
+
+    result = structurer.extract_structure("Ana CV")
+
+    assert result.full_name == "Ana"
+    assert sleeps == [3.0]
@@ -48,3 +48,16 @@ def test_job_hopping(timeline_analyzer):
     res = timeline_analyzer.analyze(cv)
     assert res.job_hopping_risk == True
     assert res.avg_tenure_months < 6
+
+def test_empty_results_are_independent(timeline_analyzer):
+    unparsable = CVData(full_name="NoDates", experience=[ExperienceEntry(title="Job", start_date="???")])
+    first = timeline_analyzer.analyze(CVData(full_name="Empty"))
+    first.detected_gaps.append("mutated by caller")
+    second = timeline_analyzer.analyze(unparsable)
+    assert second.detected_gaps == []
+    assert second.total_years_experience == 0
+
+def test_unparsable_end_date_does_not_crash(timeline_analyzer):
+    cv = CVData(full_name="Vague", experience=[ExperienceEntry(title="Job", start_date="2020-01", end_date="sometime")])
+    res = timeline_analyzer.analyze(cv)
+    assert res.avg_tenure_months == 1